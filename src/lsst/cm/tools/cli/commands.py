@@ -1,14 +1,16 @@
+import io
 import sys
-from typing import Any, Tuple
+from contextlib import contextmanager
+from typing import Any, Iterator, TextIO, Tuple
 
 import click
 
 from lsst.cm.tools.cli import options
 from lsst.cm.tools.core.db_interface import DbInterface
+from lsst.cm.tools.core.dbid import DbId
 
 from ..core.checker import Checker
 from ..core.handler import Handler
-from ..core.panda_utils import PandaChecker, print_errors_aggregate
 from ..core.utils import LevelEnum, ScriptMethod, StatusEnum, TableEnum
 
 
@@ -18,6 +20,45 @@ def cli() -> None:
     """Campaign management tool"""
 
 
+def _resolve_fullname(dbi: DbInterface, kwargs: dict[str, Any]) -> DbId:
+    """Pop `fullname` from the command options and return the matching DbId
+
+    If a fullname was given the names it contains are also added to kwargs
+    """
+    fullname = kwargs.pop("fullname")
+    if fullname is None:
+        return dbi.get_db_id(**kwargs)
+    names = dbi.parse_fullname(fullname)
+    kwargs.update(names)
+    return dbi.get_db_id(**names)
+
+
+@contextmanager
+def _buffered_stdout() -> Iterator[TextIO]:
+    """Collect a command's output and write it to stdout in one call
+
+    The summary and report commands write many short lines, and stdout is
+    line buffered on a terminal, so writing them directly flushes per line.
+    This holds the whole output in memory, so it is not used by the
+    commands whose output grows with the database: print, print_tree
+    and print_table.
+    """
+    stream = io.StringIO()
+    try:
+        yield stream
+    finally:
+        sys.stdout.write(stream.getvalue())
+
+
+def _select_entry(dbi: DbInterface, kwargs: dict[str, Any]) -> tuple[LevelEnum | None, DbId]:
+    """Return the level and DbId of the entry selected by the command options
+
+    These are the first two arguments of most of the `DbInterface` actions
+    """
+    the_db_id = dbi.get_db_id(**kwargs)
+    return the_db_id.level(), the_db_id
+
+
 @cli.command()
 @options.dbi(create=True)
 def create(dbi: DbInterface) -> None:
@@ -50,13 +91,7 @@ def insert(
 ) -> None:
     """Insert a new database entry at a particular level"""
     Handler.script_method = script_method
-    fullname = kwargs.pop("fullname")
-    if fullname is not None:
-        names = dbi.parse_fullname(fullname)
-        kwargs.update(**names)
-        the_db_id = dbi.get_db_id(**names)
-    else:
-        the_db_id = dbi.get_db_id(**kwargs)
+    the_db_id = _resolve_fullname(dbi, kwargs)
     if the_db_id.level() is not None:
         assert config_name is not None
         assert config_block is not None
@@ -81,13 +116,7 @@ def insert_step(
 ) -> None:
     """Insert a new step into an existing campaign"""
     Handler.script_method = script_method
-    fullname = kwargs.pop("fullname")
-    if fullname is not None:
-        names = dbi.parse_fullname(fullname)
-        kwargs.update(**names)
-        the_db_id = dbi.get_db_id(**names)
-    else:
-        the_db_id = dbi.get_db_id(**kwargs)
+    the_db_id = _resolve_fullname(dbi, kwargs)
 
     assert the_db_id.level() == LevelEnum.campaign
     assert config_block is not None
@@ -123,8 +152,8 @@ def summarize_output(
     **kwargs: Any,
 ) -> None:
     """Summarize the output of a particular entry"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.summarize_output(sys.stdout, the_db_id.level(), the_db_id)
+    with _buffered_stdout() as stream:
+        dbi.summarize_output(stream, *_select_entry(dbi, kwargs))
 
 
 @cli.command()
@@ -138,18 +167,11 @@ def associate_kludge(
     **kwargs: Any,
 ) -> None:
     """Kludge the butler associate command"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.associate_kludge(the_db_id.level(), the_db_id)
+    dbi.associate_kludge(*_select_entry(dbi, kwargs))
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.config_name()
 @options.config_block()
 @options.script_method()
@@ -168,13 +190,7 @@ def add_script(
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.config_name()
 @options.config_block()
 @options.script_method()
@@ -193,32 +209,18 @@ def add_job(
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 def print_tree(dbi: DbInterface, **kwargs: Any) -> None:
     """Print a database table from a given entry in a tree-like format"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.print_tree(sys.stdout, the_db_id.level(), the_db_id)
+    dbi.print_tree(sys.stdout, *_select_entry(dbi, kwargs))
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.fmt()
 def print(dbi: DbInterface, **kwargs: Any) -> None:  # pylint: disable=redefined-builtin
     """Print a database entry or entries"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.print_(sys.stdout, the_db_id.level(), the_db_id, fmt=kwargs.get("fmt"))
+    dbi.print_(sys.stdout, *_select_entry(dbi, kwargs), fmt=kwargs.get("fmt"))
 
 
 @cli.command()
@@ -235,134 +237,80 @@ def print_table(dbi: DbInterface, table: TableEnum, **kwargs: Any) -> None:
 @options.config_name()
 def print_config(dbi: DbInterface, config_name: str) -> None:
     """Print a information about a configuration"""
-    dbi.print_config(sys.stdout, config_name)
+    with _buffered_stdout() as stream:
+        dbi.print_config(stream, config_name)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script_method()
 def queue(dbi: DbInterface, script_method: ScriptMethod, **kwargs: Any) -> None:
     """Queue all the prepared jobs matching the selection"""
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.queue_jobs(the_db_id.level(), the_db_id)
+    dbi.queue_jobs(*_select_entry(dbi, kwargs))
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script_method()
 def requeue(dbi: DbInterface, script_method: ScriptMethod, **kwargs: Any) -> None:
     """Queue all the prepared jobs matching the selection"""
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.requeue_jobs(the_db_id.level(), the_db_id)
+    dbi.requeue_jobs(*_select_entry(dbi, kwargs))
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script()
 @options.script_method()
 def rerun_scripts(dbi: DbInterface, script_name: str, script_method: ScriptMethod, **kwargs: Any) -> None:
     """Rerun particular failed  scripts"""
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.rerun_scripts(the_db_id.level(), the_db_id, script_name)
+    dbi.rerun_scripts(*_select_entry(dbi, kwargs), script_name)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script_method()
 @options.max_running()
 def launch(dbi: DbInterface, script_method: ScriptMethod, max_running: int, **kwargs: Any) -> None:
     """Launch all the pending jobs matching the selection"""
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.launch_jobs(the_db_id.level(), the_db_id, max_running)
+    dbi.launch_jobs(*_select_entry(dbi, kwargs), max_running)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script_method()
 @options.username()
 def check(dbi: DbInterface, script_method: ScriptMethod, **kwargs: Any) -> None:
     """Check all the matching database entries"""
     Handler.script_method = script_method
     Checker.generic_username = kwargs.get("username", "None")
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.check(the_db_id.level(), the_db_id)
+    dbi.check(*_select_entry(dbi, kwargs))
 
 
 @cli.command("accept")
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script_method()
 @options.rescuable()
 def accept(dbi: DbInterface, script_method: ScriptMethod, rescuable: bool, **kwargs: Any) -> None:
     """Accept all the completed matching entries"""
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.accept(the_db_id.level(), the_db_id, rescuable)
+    dbi.accept(*_select_entry(dbi, kwargs), rescuable)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script_method()
 def reject(dbi: DbInterface, script_method: ScriptMethod, **kwargs: Any) -> None:
     """Reject all the matching entries"""
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.reject(the_db_id.level(), the_db_id)
+    dbi.reject(*_select_entry(dbi, kwargs))
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script_method()
 @options.purge()
 def supersede(dbi: DbInterface, script_method: ScriptMethod, **kwargs: Any) -> None:
@@ -370,113 +318,70 @@ def supersede(dbi: DbInterface, script_method: ScriptMethod, **kwargs: Any) -> N
     processing
     """
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.supersede(the_db_id.level(), the_db_id, kwargs.get("purge", False))
+    dbi.supersede(*_select_entry(dbi, kwargs), kwargs.get("purge", False))
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.status()
 @options.script_method()
 def rollback(dbi: DbInterface, status: StatusEnum, script_method: ScriptMethod, **kwargs: Any) -> None:
     """Rollback all the matching entries to a given status"""
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.rollback(the_db_id.level(), the_db_id, status)
+    dbi.rollback(*_select_entry(dbi, kwargs), status)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.status()
-@options.max_running()
+@options.max_running(help="Ignored, kept so that existing scripts still run.", hidden=True)
 @options.script_method()
 def fake_run(dbi: DbInterface, status: StatusEnum, script_method: ScriptMethod, **kwargs: Any) -> None:
     """Pretend to run workflows, this is for testing"""
     Handler.script_method = script_method
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.fake_run(the_db_id.level(), the_db_id, status)
+    dbi.fake_run(*_select_entry(dbi, kwargs), status)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script()
 @options.status()
-@options.script_method()
+@options.script_method(help="Ignored, kept so that existing scripts still run.", hidden=True)
 def fake_script(dbi: DbInterface, status: StatusEnum, script_name: str, **kwargs: Any) -> None:
     """Pretend to run scripts, this is for testing"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.fake_script(the_db_id.level(), the_db_id, script_name, status)
+    dbi.fake_script(*_select_entry(dbi, kwargs), script_name, status)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.status()
 def set_status(dbi: DbInterface, status: StatusEnum, **kwargs: Any) -> None:
     """Explicitly set the status of an entry"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.set_status(the_db_id.level(), the_db_id, status)
+    dbi.set_status(*_select_entry(dbi, kwargs), status)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script()
 @options.status()
-@options.script_method()
+@options.script_method(help="Ignored, kept so that existing scripts still run.", hidden=True)
 @options.idx()
 def set_job_status(dbi: DbInterface, status: StatusEnum, script_name: str, idx: int, **kwargs: Any) -> None:
     """Explicitly set the status of a particular job"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.set_job_status(the_db_id.level(), the_db_id, script_name, idx, status)
+    dbi.set_job_status(*_select_entry(dbi, kwargs), script_name, idx, status)
 
 
 @cli.command()
-@options.dbi()
-@options.fullname()
-@options.production()
-@options.campaign()
-@options.step()
-@options.group()
-@options.workflow()
+@options.entry_options()
 @options.script()
 @options.status()
-@options.script_method()
+@options.script_method(help="Ignored, kept so that existing scripts still run.", hidden=True)
 @options.idx()
 def set_script_status(
     dbi: DbInterface, status: StatusEnum, script_name: str, idx: int, **kwargs: Any
 ) -> None:
     """Explicitly set the status of a particular script"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.set_script_status(the_db_id.level(), the_db_id, script_name, idx, status)
+    dbi.set_script_status(*_select_entry(dbi, kwargs), script_name, idx, status)
 
 
 @cli.command()
@@ -538,7 +443,8 @@ def modify_error_type(dbi: DbInterface, error_name: str, update_item: Tuple[str,
 @options.error_name()
 def report_error_trend(dbi: DbInterface, error_name: str) -> None:
     """Report if errors have been seen in prior workflows and if so, when"""
-    dbi.report_error_trend(sys.stdout, error_name)
+    with _buffered_stdout() as stream:
+        dbi.report_error_trend(stream, error_name)
 
 
 @cli.command()
@@ -578,25 +484,32 @@ def extend(dbi: DbInterface, config_yaml: str, config_name: str) -> None:
 
 @cli.command()
 @options.dbi()
-@options.panda_url(type=int)
+@options.panda_url(type=int, multiple=True, required=True)
 @options.username()
-def check_panda_job(dbi: DbInterface, panda_url: int, username: str) -> list[str]:
-    """Check the status of a panda job"""
+def check_panda_job(dbi: DbInterface, panda_url: tuple[int, ...], username: str) -> None:
+    """Check the status of one or more panda jobs"""
+    # panda_utils pulls in the panda client stack, so only import it here
+    from ..core.panda_utils import PandaChecker, print_errors_aggregate
+
     pc = PandaChecker()
-    status, errors_aggregate = pc.check_panda_status(dbi, panda_url, username)
-    errors_aggregate["panda_status"] = status
-    print_errors_aggregate(sys.stdout, errors_aggregate)
+    for panda_reqid in panda_url:
+        status, errors_aggregate = pc.check_panda_status(dbi, panda_reqid, username)
+        errors_aggregate["panda_status"] = status
+        print_errors_aggregate(sys.stdout, errors_aggregate)
 
 
 @cli.command()
 @options.dbi()
-@options.panda_url(type=int)
+@options.panda_url(type=int, multiple=True, required=True)
 @options.username()
-def get_panda_errors(dbi: DbInterface, panda_url: int, username: str):
-    """Check the status of a finished panda task"""
+def get_panda_errors(dbi: DbInterface, panda_url: tuple[int, ...], username: str) -> None:
+    """Check the status of one or more finished panda tasks"""
+    from ..core.panda_utils import PandaChecker, print_errors_aggregate
+
     pc = PandaChecker()
-    errors_aggregate, _, _ = pc.get_panda_errors(dbi, panda_url, username)
-    print_errors_aggregate(sys.stdout, errors_aggregate)
+    for panda_reqid in panda_url:
+        errors_aggregate, _, _ = pc.get_panda_errors(dbi, panda_reqid, username)
+        print_errors_aggregate(sys.stdout, errors_aggregate)
 
 
 @cli.command()
@@ -610,5 +523,5 @@ def report_errors(
     **kwargs: Any,
 ) -> None:
     """Summarize the output of a particular entry"""
-    the_db_id = dbi.get_db_id(**kwargs)
-    dbi.report_errors(sys.stdout, the_db_id.level(), the_db_id, **kwargs)
+    with _buffered_stdout() as stream:
+        dbi.report_errors(stream, *_select_entry(dbi, kwargs), **kwargs)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from enum import Enum
 from functools import partial, wraps
 from typing import Any, Callable, Type, TypeVar, cast
@@ -8,7 +10,6 @@ from click.decorators import _AnyCallable
 from ..core.db_interface import DbInterface
 from ..core.handler import Handler
 from ..core.utils import LevelEnum, ScriptMethod, StatusEnum, TableEnum
-from ..db.sqlalch_interface import SQLAlchemyInterface
 
 __all__ = [
     "butler",
@@ -19,11 +20,13 @@ __all__ = [
     "data_query",
     "diag_message",
     "dbi",
+    "entry_options",
     "error_name",
     "error_yaml",
     "fmt",
     "fullname",
     "group",
+    "id_options",
     "idx",
     "level",
     "log_file",
@@ -54,27 +57,76 @@ __all__ = [
 
 EnumType_co = TypeVar("EnumType_co", bound=Type[Enum], covariant=True)
 
+# One path type, shared by the options that take a yaml file
+_yaml_path = click.Path()
+
 
 class EnumChoice(click.Choice):
     """A version of click.Choice specialized for enum types"""
 
+    _cache: dict[tuple[type, bool], EnumChoice] = {}
+
     def __init__(self, enum: EnumType_co, case_sensitive: bool = True) -> None:
         self._enum = enum
-        super().__init__(list(enum.__members__.keys()), case_sensitive=case_sensitive)
+        # the dict behind enum.__members__, so lookups skip the proxy
+        self._members = enum._member_map_
+        super().__init__(tuple(enum._member_names_), case_sensitive=case_sensitive)
 
     def convert(self, value: Any, param: click.Parameter | None, ctx: click.Context | None) -> EnumType_co:
+        # exact member names, which is what is normally given,
+        # do not need click's normalization and matching
+        if value in self._members:
+            return self._members[value]
         converted_str = super().convert(value, param, ctx)
-        return self._enum.__members__[converted_str]
+        return self._members[converted_str]
+
+    @classmethod
+    def for_enum(cls, enum: EnumType_co, case_sensitive: bool = True) -> EnumChoice:
+        """Return the shared EnumChoice for an enum, built on first use"""
+        key = (enum, case_sensitive)
+        choice = cls._cache.get(key)
+        if choice is None:
+            choice = cls(enum, case_sensitive)
+            cls._cache[key] = choice
+        return choice
 
 
 class PartialOption:
     """Wraps click.option with partial arguments for convenient reuse"""
 
+    __slots__ = ("_param_decls", "_kwargs", "_default")
+
     def __init__(self, *param_decls: Any, **kwargs: Any) -> None:
-        self._partial = partial(click.option, *param_decls, cls=partial(click.Option), **kwargs)
+        kwargs.setdefault("cls", click.Option)
+        self._param_decls = param_decls
+        self._kwargs = kwargs
+        # Most commands use an option without overrides,
+        # so that decorator is built once and shared
+        self._default = click.option(*param_decls, **kwargs)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        return self._partial(*args, **kwargs)
+        if not args and not kwargs:
+            return self._default
+        return click.option(*self._param_decls, *args, **{**self._kwargs, **kwargs})
+
+
+class OptionGroup:
+    """Bundles a fixed stack of option decorators into one decorator
+
+    The decorators are given in the order they would be stacked on a
+    command, and are applied bottom-up, as stacked decorators are
+    """
+
+    def __init__(self, *decorators: Callable[[_AnyCallable], _AnyCallable]) -> None:
+        self._decorators = tuple(reversed(decorators))
+
+    def _apply(self, f: _AnyCallable) -> _AnyCallable:
+        for decorator in self._decorators:
+            f = decorator(f)
+        return f
+
+    def __call__(self) -> Callable[[_AnyCallable], _AnyCallable]:
+        return self._apply
 
 
 echo = PartialOption(
@@ -85,14 +137,14 @@ echo = PartialOption(
 
 level = PartialOption(
     "--level",
-    type=EnumChoice(LevelEnum),
+    type=EnumChoice.for_enum(LevelEnum),
     default=None,
     help="Which level to match.",
 )
 
 table = PartialOption(
     "--table",
-    type=EnumChoice(TableEnum),
+    type=EnumChoice.for_enum(TableEnum),
     default="workflow",
     help="Which database table to manipulate.",
 )
@@ -105,14 +157,14 @@ fmt = PartialOption(
 
 status = PartialOption(
     "--status",
-    type=EnumChoice(StatusEnum),
+    type=EnumChoice.for_enum(StatusEnum),
     default="completed",
     help="Status level to set.",
 )
 
 script_method = PartialOption(
     "--script_method",
-    type=EnumChoice(ScriptMethod),
+    type=EnumChoice.for_enum(ScriptMethod),
     default="bash",
     envvar="CM_SCRIPT_METHOD",
     help="How to submit scripts.",
@@ -168,7 +220,7 @@ data_query = PartialOption(
 
 config_yaml = PartialOption(
     "--config-yaml",
-    type=click.Path(),
+    type=_yaml_path,
     help="Configuration Yaml.",
 )
 
@@ -213,6 +265,14 @@ workflow = PartialOption(
     help="Workflow index.",
 )
 
+id_options = OptionGroup(
+    production(),
+    campaign(),
+    step(),
+    group(),
+    workflow(),
+)
+
 script = PartialOption(
     "--script-name",
     help="Script name.",
@@ -317,7 +377,7 @@ error_name = PartialOption(
 
 error_yaml = PartialOption(
     "--error-yaml",
-    type=click.Path(),
+    type=_yaml_path,
     help="Yaml file with errors to match",
 )
 
@@ -335,14 +395,33 @@ yaml_output = PartialOption(
 )
 
 
+def _record_meta(ctx: click.Context, param: click.Parameter, value: Any) -> None:
+    """Stash the value of a database option for use by `_make_dbi`"""
+    if value and param.name:
+        ctx.meta[param.name] = value
+
+
+def _make_dbi(create: bool, ctx: click.Context, param: click.Parameter, value: Any) -> DbInterface:
+    """Build the database interface from the stashed option values"""
+    # Deferred so that `cm --help` and option parsing do not pull in
+    # SQLAlchemy and the handler modules
+    from ..db.sqlalch_interface import SQLAlchemyInterface
+
+    db_url = ctx.meta.get("db", param.get_default(ctx))
+    Handler.plugin_dir = ctx.meta.get("plugin_dir", param.get_default(ctx))
+    Handler.config_dir = ctx.meta.get("config_dir", param.get_default(ctx))
+    return SQLAlchemyInterface(db_url, echo=ctx.meta.get("echo", param.get_default(ctx)), create=create)
+
+
 def dbi(create: bool = False) -> Callable[[_AnyCallable], _AnyCallable]:
     """Set up interface to underlying databases."""
+    make_dbi = partial(_make_dbi, create)
 
     def decorator(f: _AnyCallable) -> _AnyCallable:
-        @db(expose_value=False, callback=record_meta)
-        @plugin_dir(expose_value=False, callback=record_meta)
-        @config_dir(expose_value=False, callback=record_meta)
-        @echo(expose_value=False, callback=record_meta)
+        @db(expose_value=False, callback=_record_meta)
+        @plugin_dir(expose_value=False, callback=_record_meta)
+        @config_dir(expose_value=False, callback=_record_meta)
+        @echo(expose_value=False, callback=_record_meta)
         @click.option("--dbi", hidden=True, callback=make_dbi)
         @wraps(f)
         def wrapper(*args, **kwargs):  # type: ignore
@@ -350,14 +429,11 @@ def dbi(create: bool = False) -> Callable[[_AnyCallable], _AnyCallable]:
 
         return cast(_AnyCallable, wrapper)
 
-    def record_meta(ctx: click.Context, param: click.Parameter, value: Any) -> None:
-        if value and param.name:
-            ctx.meta[param.name] = value
+    return decorator
 
-    def make_dbi(ctx: click.Context, param: click.Parameter, value: Any) -> DbInterface:
-        db_url = ctx.meta.get("db", param.get_default(ctx))
-        Handler.plugin_dir = ctx.meta.get("plugin_dir", param.get_default(ctx))
-        Handler.config_dir = ctx.meta.get("config_dir", param.get_default(ctx))
-        return SQLAlchemyInterface(db_url, echo=ctx.meta.get("echo", param.get_default(ctx)), create=create)
 
-    return decorator
+entry_options = OptionGroup(
+    dbi(),
+    fullname(),
+    id_options(),
+)
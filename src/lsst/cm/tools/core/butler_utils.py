@@ -1,13 +1,24 @@
-from typing import Iterable
+from typing import Any, Iterable
 
 import numpy as np
 from lsst.daf.butler import Butler, CollectionType
 
 
-def get_sorted_array(itr: Iterable, field: str) -> np.ndarray:
-    """Sort an array."""
-    the_array = np.array([x_[field] for x_ in itr])
-    return np.sort(the_array)
+def get_sorted_array(itr: Iterable, field: str, dtype: Any = np.int64) -> np.ndarray:
+    """Return the sorted, unique values of `field` from `itr`.
+
+    The values are read straight into a typed array, rather than through
+    an intermediate list, and sorted and de-duplicated by numpy.
+    The fields used to split up data queries are integer dimensions,
+    hence the default `dtype`.
+
+    The registry often returns the values already in order, that is
+    checked for in one pass, and the sort is skipped if so.
+    """
+    the_array = np.fromiter((x_[field] for x_ in itr), dtype=dtype)
+    if the_array.size > 1 and (the_array[1:] >= the_array[:-1]).all():
+        return the_array[np.concatenate(([True], the_array[1:] != the_array[:-1]))]
+    return np.unique(the_array)
 
 
 def print_dataset_summary(stream, butler_url: str, collections: list[str]) -> None:
@@ -26,21 +37,20 @@ def print_dataset_summary(stream, butler_url: str, collections: list[str]) -> No
         metadata=metadata_dict,
         log=log_dict,
     )
+    suffix_dicts = dict(
+        config=config_dict,
+        schema=schema_dict,
+        metadata=metadata_dict,
+        log=log_dict,
+    )
     for results in butler.registry.queryDatasets(...).byParentDatasetType():
         n_dataset = results.count(exact=False)
         ds_name = results.parentDatasetType.name
         if n_dataset == 0:
             continue
-        if ds_name.find("_config") > 0:
-            which_dict = config_dict
-        elif ds_name.find("_schema") > 0:
-            which_dict = schema_dict
-        elif ds_name.find("_metadata") > 0:
-            which_dict = metadata_dict
-        elif ds_name.find("_log") > 0:
-            which_dict = log_dict
-        else:
-            which_dict = summary_dict
+        # task outputs are named {task}_{suffix}, the rest are data products
+        prefix, _, suffix = ds_name.rpartition("_")
+        which_dict = suffix_dicts.get(suffix, summary_dict) if prefix else summary_dict
         which_dict[results.parentDatasetType.name] = (n_dataset, results.parentDatasetType)
     for dict_name, a_dict in sorted(dict_of_dicts.items()):
         stream.write(f"{dict_name} --------------\n")
@@ -106,13 +116,12 @@ def clean_collection_set(
         existing_colls = []
         for input_coll_ in input_colls_:
             colls = butler.registry.queryCollections(input_coll_)
+            # only need to know if there is at least one match
             try:
-                count = 0
-                for cc in colls:
-                    count += 1
+                has_any = next(iter(colls), None) is not None
             except Exception:
-                count = 0
-            if count:
+                has_any = False
+            if has_any:
                 existing_colls.append(input_coll_)
         output_colls.append(existing_colls)
     return output_colls
@@ -133,15 +142,17 @@ def butler_associate_kludge(
     tagged_coll = output_coll + "_tagged"
 
     butler.registry.registerCollection(tagged_coll, CollectionType.TAGGED)
-    for input_colls_ in input_colls[1:]:
-        refset = butler.registry.queryDatasets(
-            ...,
-            collections=input_colls_,
-            findFirst=True,
-        ).byParentDatasetType()
-        for refs in refset:
-            if refs.parentDatasetType.dimensions:
-                butler.registry.associate(tagged_coll, refs)
+    # one transaction for all the associations, not one per dataset type
+    with butler.transaction():
+        for input_colls_ in input_colls[1:]:
+            refset = butler.registry.queryDatasets(
+                ...,
+                collections=input_colls_,
+                findFirst=True,
+            ).byParentDatasetType()
+            for refs in refset:
+                if refs.parentDatasetType.dimensions:
+                    butler.registry.associate(tagged_coll, refs)
     butler.registry.registerCollection(output_coll, CollectionType.CHAINED)
     all_cols = first_colls + [tagged_coll]
     butler.registry.setCollectionChain(output_coll, all_cols)
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import types
+from functools import lru_cache
 from typing import Any
 
-from lsst.utils import doImport
-from lsst.utils.introspection import get_full_type_name
-
 from lsst.cm.tools.core.db_interface import DbInterface, ScriptBase
 
 
+@lru_cache(maxsize=None)
+def _class_full_name(checker_class: type) -> str:
+    """Return the full name of a Checker class, this is fixed per class"""
+    from lsst.utils.introspection import get_full_type_name
+
+    return get_full_type_name(checker_class)
+
+
 class Checker:
     """Base class to check on script status
 
@@ -44,6 +50,9 @@ class Checker:
         """
         cached_checker = Checker.checker_cache.get(class_name)
         if cached_checker is None:
+            # deferred, lsst.utils pulls in numpy and is slow to import
+            from lsst.utils import doImport
+
             checker_class = doImport(class_name)
             if isinstance(checker_class, types.ModuleType):
                 raise TypeError()
@@ -53,7 +62,7 @@ class Checker:
 
     def get_checker_class_name(self) -> str:
         """Return this class's full name"""
-        return get_full_type_name(self)
+        return _class_full_name(type(self))
 
     def check_url(self, dbi: DbInterface, script: ScriptBase) -> dict[str, Any]:
         """Return the status of the script being checked
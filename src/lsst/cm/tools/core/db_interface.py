@@ -52,6 +52,25 @@ class TableBase:
         """
         raise NotImplementedError()
 
+    @classmethod
+    def update_many(cls, dbi: DbInterface, row_ids: list[int], **kwargs: Any) -> None:
+        """Update the values in several entries at once
+
+        Parameters
+        ----------
+        dbi : DbInterface
+            Interface to the database
+
+        row_ids : list[int]
+            Ids of the entries we are updating
+
+        Keywords
+        --------
+        Give the values to update, the same for every entry
+
+        """
+        raise NotImplementedError()
+
 
 class ScriptBase(TableBase):
     """Interface class for database entries describing Scripts and Jobs
@@ -312,6 +331,25 @@ class DbInterface:
         """
         raise NotImplementedError()
 
+    def count_child_status(self, level: LevelEnum, db_id: DbId) -> dict[StatusEnum, int]:
+        """Count the children of an entry in each status
+
+        Parameters
+        ----------
+        level : LevelEnum
+            Selects which database table the parent entry is in
+
+        db_id : DbId
+            Database ID specifying the parent entry.
+            See class notes above.
+
+        Returns
+        -------
+        status_counts : dict[StatusEnum, int]
+            Number of children, ignoring superseded ones, in each status
+        """
+        raise NotImplementedError()
+
     def get_config(self, config_name: str) -> ConfigBase:
         """Return a selected configuration object
 
@@ -1030,6 +1068,25 @@ class DbInterface:
         """
         raise NotImplementedError()
 
+    def count_errors(self, level: LevelEnum, db_id: DbId) -> int:
+        """Count the errors associated with a particular entry
+
+        Parameters
+        ----------
+        level: LevelEnum
+            Selects which database table to start with
+
+        db_id: DbId
+            Database ID specifying which entry to count errors for.
+            See class notes above.
+
+        Returns
+        -------
+        n_errors : int
+            Number of errors attached to jobs under this entry
+        """
+        raise NotImplementedError()
+
     def report_error_trend(self, stream: TextIO, error_name: str) -> None:
         """Report if errors have been seen in prior workflows and if so, when
 
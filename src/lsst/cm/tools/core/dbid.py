@@ -6,7 +6,7 @@ from typing import Optional
 from lsst.cm.tools.core.utils import LevelEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class DbId:
     """Information to identify a single entry in the CM database tables
 
@@ -3,9 +3,6 @@ from __future__ import annotations
 import types
 from typing import TYPE_CHECKING, Any
 
-from lsst.utils import doImport
-from lsst.utils.introspection import get_full_type_name
-
 from lsst.cm.tools.core.utils import InputType, OutputType, ScriptMethod, StatusEnum
 
 from .utils import add_sys_path
@@ -73,6 +70,9 @@ class Handler:
         """
         cached_handler = Handler.handler_cache.get(fragment_id)
         if cached_handler is None:
+            # deferred, lsst.utils pulls in numpy and is slow to import
+            from lsst.utils import doImport
+
             with add_sys_path(Handler.plugin_dir):
                 handler_class = doImport(class_name)
             if isinstance(handler_class, types.ModuleType):
@@ -93,6 +93,8 @@ class Handler:
 
     def get_handler_class_name(self) -> str:
         """Return this class's full name"""
+        from lsst.utils.introspection import get_full_type_name
+
         return get_full_type_name(self)
 
     def get_config_var(self, varname: str, default: Any, **kwargs: Any) -> Any:
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, TextIO
 
 import idds.common.utils as idds_utils
@@ -34,14 +35,11 @@ def parse_bps_stdout(url: str) -> dict[str, str]:
     """Parse the std from a bps submit job"""
     out_dict = {}
     with open(url, "r", encoding="utf8") as fin:
-        line = fin.readline()
-        while line:
+        for line in fin:
             tokens = line.split(":")
             if len(tokens) != 2:  # pragma: no cover
-                line = fin.readline()
                 continue
             out_dict[tokens[0]] = tokens[1]
-            line = fin.readline()
     return out_dict
 
 
@@ -210,7 +208,7 @@ def determine_error_handling(dbi: DbInterface, errors_agg: dict, max_pct_failed:
         errors
     """
     # bad untested psuedo code
-    decision_results = []
+    decision_results: set[str] = set()
     for key in errors_agg.keys():
         # for a given error, try to make a match
         error_items = errors_agg[key]
@@ -247,7 +245,7 @@ def determine_error_handling(dbi: DbInterface, errors_agg: dict, max_pct_failed:
                     temp_status = "failed_review"
                 else:
                     temp_status = "done"
-            decision_results.append(temp_status)
+            decision_results.add(temp_status)
 
     # now based on the worst result in decison_results, set panda_status
     if "failed_pause" in decision_results:
@@ -314,8 +312,9 @@ def decide_panda_status(dbi: DbInterface, statuses: list, errors_agg: dict, max_
     panda_status: str
         the panda job status
     """
-    # take our statuses and convert them
-    status_mapped = [jtid_status_map[status] for status in statuses]
+    # take our statuses and convert them, only which
+    # end results are present matters, so keep a set
+    status_mapped = frozenset(jtid_status_map[status] for status in statuses)
 
     if "running" in status_mapped:
         panda_status = "running"
@@ -331,7 +330,8 @@ def decide_panda_status(dbi: DbInterface, statuses: list, errors_agg: dict, max_
         panda_status = "running"
     else:  # pragma: no cover
         raise ValueError(
-            f"decide_panda_status failed to make a decision based on this status vector: {str(status_mapped)}"
+            "decide_panda_status failed to make a decision based on this status vector: "
+            f"{sorted(status_mapped)}"
         )
     return panda_status
 
@@ -390,11 +390,19 @@ def check_panda_status(dbi: DbInterface, panda_reqid: int, panda_username=None)
     return panda_status, errors_aggregate
 
 
+@lru_cache(maxsize=1)
+def get_idds_api() -> Any:  # pragma: no cover
+    """Return the IDDS client, built once and shared by every
+    reqID looked up in this process
+    """
+    return pandaclient.idds_api.get_api(idds_utils.json_dumps, idds_host=None, compress=True, manager=True)
+
+
 def get_panda_errors(
     dbi: DbInterface, panda_reqid: int, panda_username=None
 ) -> tuple[Any]:  # pragma: no cover
     """Get panda errors for a given reqID."""
-    conn = pandaclient.idds_api.get_api(idds_utils.json_dumps, idds_host=None, compress=True, manager=True)
+    conn = get_idds_api()
 
     ret = conn.get_requests(request_id=int(panda_reqid), with_detail=True)
 
@@ -452,12 +460,11 @@ class PandaChecker(SlurmChecker):  # pragma: no cover
         failed_pause=StatusEnum.reviewable,
     )
 
+    active_states = frozenset([StatusEnum.populating, StatusEnum.running])
+
     def check_url(self, dbi: DbInterface, job: JobBase) -> dict[str, Any]:
         update_vals: dict[str, Any] = {}
-        if job.status not in [
-            StatusEnum.populating,
-            StatusEnum.running,
-        ]:
+        if job.status not in self.active_states:
             return update_vals
         panda_url = job.panda_url
         if panda_url is None:
@@ -2,13 +2,11 @@ import os
 import subprocess
 from typing import Any, Optional
 
-import yaml
-
 from lsst.cm.tools.core.checker import Checker
 from lsst.cm.tools.core.db_interface import CMTableBase, DbInterface, ScriptBase, TableBase
 from lsst.cm.tools.core.rollback import Rollback
 from lsst.cm.tools.core.slurm_utils import submit_job
-from lsst.cm.tools.core.utils import ScriptMethod, StatusEnum, safe_makedirs
+from lsst.cm.tools.core.utils import ScriptMethod, StatusEnum, safe_load_yaml, safe_makedirs
 
 
 def write_status_to_yaml(stamp_url: str, status: StatusEnum) -> None:
@@ -45,7 +43,7 @@ def check_status_from_yaml(stamp_url: str, current_status: StatusEnum) -> Status
     if not os.path.exists(stamp_url):
         return current_status
     with open(stamp_url, "rt", encoding="utf-8") as fin:
-        fields = yaml.safe_load(fin)
+        fields = safe_load_yaml(fin)
     return StatusEnum[fields["status"]]
 
 
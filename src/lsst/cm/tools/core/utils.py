@@ -4,7 +4,14 @@ import contextlib
 import enum
 import os
 import sys
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import IO, TYPE_CHECKING, Any, Iterator, Optional
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore
 
 if TYPE_CHECKING:  # pragma: no cover
     from _typeshed import StrOrBytesPath
@@ -104,7 +111,9 @@ class StatusEnum(enum.Enum):
 
     def bad(self) -> bool:
         """Can be used to filter out failed and rejected runs"""
-        return self.value < 0
+        # _value_ is a plain instance attribute, unlike the
+        # `value` property, so this is cheap inside loops
+        return self._value_ < 0
 
 
 class LevelEnum(enum.Enum):
@@ -136,15 +145,20 @@ class LevelEnum(enum.Enum):
 
     def parent(self) -> Optional[LevelEnum]:
         """Return the parent level, or `None` if does not exist"""
-        if self.value == 0:
-            return None
-        return LevelEnum(self.value - 1)
+        return level_parent_map[self]
 
     def child(self) -> Optional[LevelEnum]:
         """Return the child level, or `None` if does not exist"""
-        if self.value == 4:
-            return None
-        return LevelEnum(self.value + 1)
+        return level_child_map[self]
+
+
+# The hierarchy is fixed, so resolve the neighbouring levels once
+# here rather than doing a LevelEnum(value) lookup on every call
+_levels = list(LevelEnum)
+
+level_parent_map: dict[LevelEnum, Optional[LevelEnum]] = dict(zip(_levels, [None] + _levels[:-1]))
+
+level_child_map: dict[LevelEnum, Optional[LevelEnum]] = dict(zip(_levels, _levels[1:] + [None]))
 
 
 class TableEnum(enum.Enum):
@@ -300,3 +314,10 @@ def add_sys_path(path: os.PathLike | str | None) -> Iterator[None]:
             yield
         finally:
             sys.path.remove(path)
+
+
+def safe_load_yaml(stream: IO[str] | str) -> Any:
+    """Same as `yaml.safe_load`, but using the libyaml based
+    loader when it is available, which is much faster
+    """
+    return yaml.load(stream, Loader=SafeLoader)
@@ -63,7 +63,7 @@ class Campaign(common.Base, common.CMTable):
     jobs_: Iterable = relationship("Job", back_populates="c_")
     depend_: Iterable = relationship("Dependency", back_populates="c_")
 
-    match_keys = [p_id, id]
+    match_keys = (p_id, id)
 
     @hybrid_property
     def parent_id(self) -> Any:
@@ -89,8 +89,7 @@ class Campaign(common.Base, common.CMTable):
 
     def children(self) -> Iterable:
         """Maps self.s_ to self.children() for consistency"""
-        for step in self.s_:
-            yield step
+        return self.s_
 
     def sub_iterators(self) -> list[Iterable]:
         """Iterators over sub-entries, used for recursion"""
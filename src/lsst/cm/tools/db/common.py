@@ -1,7 +1,9 @@
 from collections import OrderedDict
-from typing import Any, Iterable, TextIO
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Sequence, TextIO
 
-from sqlalchemy import select, update
+from sqlalchemy import Table, select, update
 from sqlalchemy.orm import declarative_base
 
 from lsst.cm.tools.core.checker import Checker
@@ -12,6 +14,22 @@ from lsst.cm.tools.core.rollback import Rollback
 from lsst.cm.tools.core.utils import LevelEnum, StatusEnum
 
 
+@lru_cache(maxsize=None)
+def column_getter(table: Table) -> tuple[list[str], Callable[[Any], tuple]]:
+    """Return the column names of a table and a getter for those columns
+
+    The getter is built once per table, so that as_dict does not have to
+    do a getattr call for each column of each row.  It always returns a
+    tuple, even for a table with a single column.
+    """
+    names = table.columns.keys()
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        # attrgetter with one name returns the bare value
+        return names, lambda obj: (getter(obj),)
+    return names, getter
+
+
 class SQLTableMixin:
     """Provides implementation of some common
     functions for Database tables
@@ -21,10 +39,16 @@ class SQLTableMixin:
 
     depend_: Iterable
     id: int | None
+    frag_: FragmentBase | None
 
     def __init__(self, id: int) -> None:
         self.id = id
 
+    def get_handler(self) -> Handler:
+        """Return a Handler for this entry"""
+        assert self.frag_ is not None
+        return self.frag_.get_handler()
+
     @classmethod
     def insert_values(cls, dbi: DbInterface, **kwargs: Any) -> Any:
         """Inserts a new row at a given level with values given in kwargs"""
@@ -41,6 +65,19 @@ class SQLTableMixin:
         upd_result = conn.execute(stmt)
         check_result(upd_result)
 
+    @classmethod
+    def update_many(cls, dbi: DbInterface, row_ids: list[int], **kwargs: Any) -> None:
+        """Updates several rows with the same values given in kwargs
+
+        This is a single UPDATE, rather than one per row
+        """
+        if not row_ids:
+            return
+        stmt = update(cls).where(cls.id.in_(row_ids)).values(**kwargs)
+        conn = dbi.connection()
+        upd_result = conn.execute(stmt)
+        check_result(upd_result)
+
     def check_prerequistes(self, dbi: DbInterface) -> bool:
         """Check the prerequisites of an entry"""
         for dep_ in self.depend_:
@@ -51,7 +88,8 @@ class SQLTableMixin:
 
     def as_dict(self) -> dict[str, Any]:
         """Return row as a dict"""
-        return OrderedDict([(c.name, getattr(self, c.name)) for c in self.__table__.columns])
+        names, getter = column_getter(self.__table__)
+        return OrderedDict(zip(names, getter(self)))
 
     def print_full(self) -> None:
         """Print full row"""
@@ -69,14 +107,8 @@ class SQLScriptMixin(SQLTableMixin):
     """
 
     id: int | None
-    frag_: FragmentBase | None
     status: StatusEnum
 
-    def get_handler(self) -> Handler:
-        """Return a Handler for this entry"""
-        assert self.frag_ is not None
-        return self.frag_.get_handler()
-
     @classmethod
     def check_status(cls, dbi: DbInterface, script: ScriptBase) -> StatusEnum:
         """Check the status of a script"""
@@ -112,15 +144,10 @@ class CMTable(SQLTableMixin, CMTableBase):
     level = LevelEnum.production
 
     name: str | None
-    frag_: FragmentBase | None
     config_: ConfigBase | None
-    match_keys: list[str] = []
+    match_keys: Sequence[Any] = ()
     parent_id: Any
 
-    def get_handler(self) -> Handler:
-        assert self.frag_
-        return self.frag_.get_handler()
-
     def get_sub_handler(self, config_block: str) -> Handler:
         assert self.config_
         return self.config_.get_sub_handler(config_block)
@@ -147,6 +174,9 @@ class CMTable(SQLTableMixin, CMTableBase):
 
 Base = declarative_base()
 
+# Number of rows fetched at a time when printing tables
+print_batch_size = 500
+
 
 def check_result(result: Any) -> None:
     """Placeholder function to check on SQL query results"""
@@ -165,9 +195,13 @@ def return_first_column(dbi: DbInterface, sel: Any) -> int | None:
 
 
 def print_select(dbi: DbInterface, stream: TextIO, sel: Any, fmt: str | None) -> None:
-    """Prints all the rows matching a selection"""
+    """Prints all the rows matching a selection
+
+    Rows are fetched in batches of `print_batch_size` and written
+    out as they arrive, rather than loading the whole table first
+    """
     conn = dbi.connection()
-    sel_result = conn.execute(sel)
+    sel_result = conn.execute(sel.execution_options(yield_per=print_batch_size))
     check_result(sel_result)
     for row in sel_result:
         if fmt is None:
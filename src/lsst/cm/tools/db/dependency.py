@@ -43,7 +43,7 @@ class Dependency(DependencyBase, common.Base):
     w_: Iterable = relationship("Workflow", back_populates="depend_")
     db_id: DbId = composite(DbId, p_id, c_id, s_id, g_id, w_id)
     depend_db_id: DbId = composite(DbId, depend_p_id, depend_c_id, depend_s_id, depend_g_id, depend_w_id)
-    depend_keys = [depend_p_id, depend_c_id, depend_s_id, depend_g_id]
+    depend_keys = (depend_p_id, depend_c_id, depend_s_id, depend_g_id)
 
     def __repr__(self) -> str:
         return f"Dependency {self.db_id}: {self.depend_db_id}"
@@ -1,7 +1,7 @@
 import enum
 from typing import Iterable
 
-from sqlalchemy import Boolean, Column, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Enum, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from lsst.cm.tools.db import common
@@ -65,6 +65,8 @@ class ErrorInstance(common.Base):
 
     __tablename__ = "error_instance"
     __allow_unmapped__ = True
+    # Errors are always looked up by job, and often by type within a job
+    __table_args__ = (Index("ix_error_instance_job_type", "job_id", "error_type_id"),)
 
     id = Column(Integer, primary_key=True)  # Unique ID
     job_id = Column(Integer, ForeignKey(Job.id))
@@ -61,7 +61,7 @@ class Group(common.Base, common.CMTable):
     jobs_: Iterable = relationship("Job", back_populates="g_")
     depend_: Iterable = relationship("Dependency", back_populates="g_")
 
-    match_keys = [p_id, c_id, s_id, id]
+    match_keys = (p_id, c_id, s_id, id)
 
     @hybrid_property
     def butler_repo(self) -> Any:
@@ -95,8 +95,7 @@ class Group(common.Base, common.CMTable):
 
     def children(self) -> Iterable:
         """Maps self.w_ to self.children() for consistency"""
-        for workflow in self.w_:
-            yield workflow
+        return self.w_
 
     def sub_iterators(self) -> list[Iterable]:
         """Iterators over sub-entries, used for recursion"""
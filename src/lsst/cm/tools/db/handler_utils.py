@@ -1,6 +1,8 @@
 from typing import Any, Iterable
 
 import numpy as np
+from sqlalchemy import and_, select
+from sqlalchemy.orm import with_parent
 
 from lsst.cm.tools.core.db_interface import DbInterface
 from lsst.cm.tools.core.dbid import DbId
@@ -41,87 +43,103 @@ validate_script_status_map = {
 }
 
 
-def extract_child_status(itr: Iterable, min_status: StatusEnum, max_status: StatusEnum) -> StatusEnum:
-    """Return the status of all children in an array"""
-    child_status = np.array([x.status.value for x in itr if not x.superseded])
-    if not child_status.size:  # pragma: no cover
+def extract_child_status(
+    status_counts: dict[StatusEnum, int], min_status: StatusEnum, max_status: StatusEnum
+) -> StatusEnum:
+    """Return the status of all children from their per-status counts"""
+    if not status_counts:  # pragma: no cover
         return min_status
-    if (child_status >= StatusEnum.accepted.value).all():
+    child_min = min(status.value for status in status_counts)
+    if child_min >= StatusEnum.accepted.value:
         return max_status
-    status_val = min(max_status.value, max(min_status.value, child_status.min()))
+    status_val = min(max_status.value, max(min_status.value, child_min))
     return StatusEnum(status_val)
 
 
-def extract_completion_status(itr: Iterable, min_status: StatusEnum, max_status: StatusEnum) -> StatusEnum:
-    """Return the status of all children in an array,
+def extract_completion_status(
+    status_counts: dict[StatusEnum, int], min_status: StatusEnum, max_status: StatusEnum
+) -> StatusEnum:
+    """Return the status of all children from their per-status counts,
     specific to running jobs to collectable
     """
-    child_status = np.array([x.status.value for x in itr if not x.superseded])
-    if not child_status.size:  # pragma: no cover
+    if not status_counts:  # pragma: no cover
         return min_status
-    if (child_status >= StatusEnum.accepted.value).all() and (
-        child_status == StatusEnum.accepted.value
-    ).any():
+    child_min = min(status.value for status in status_counts)
+    if child_min >= StatusEnum.accepted.value and StatusEnum.accepted in status_counts:
         return max_status
     return min_status
 
 
 def extract_scripts_status(itr: Iterable, script_type: ScriptType) -> StatusEnum:
     """Check the status all the scripts of a given type"""
-    scripts_status = np.array(
-        [x.status.value for x in itr if (x.script_type == script_type) and not x.superseded]
+    scripts_status = np.fromiter(
+        (x.status.value for x in itr if (x.script_type == script_type) and not x.superseded), dtype=int
     )
     # should never be called on entries with no scripts
     assert scripts_status.size
-    if (scripts_status >= StatusEnum.accepted.value).all():
+    # reduce once, then test the extrema rather than
+    # rescanning the whole array for every condition
+    min_status = scripts_status.min()
+    if min_status >= StatusEnum.accepted.value:
         return StatusEnum.accepted
-    if (scripts_status >= StatusEnum.completed.value).all():
+    if min_status >= StatusEnum.completed.value:
         return StatusEnum.completed
-    if (scripts_status < 0).any():
+    if min_status < 0:
         return StatusEnum.failed
-    if (scripts_status >= StatusEnum.running.value).any():
+    if scripts_status.max() >= StatusEnum.running.value:
         return StatusEnum.running
     return StatusEnum.ready
 
 
 def extract_job_status(itr: Iterable) -> StatusEnum:
     """Check the status of a set of jobs"""
-    job_status = np.array([x.status.value for x in itr if not x.superseded])
+    job_status = np.fromiter((x.status.value for x in itr if not x.superseded), dtype=int)
     assert job_status.size
 
-    if (job_status >= StatusEnum.rescuable.value).all():
+    # reduce once, then test the extrema rather than
+    # rescanning the whole array for every condition
+    min_status = job_status.min()
+    if min_status >= StatusEnum.rescuable.value:
         return StatusEnum.rescuable
-    if (job_status >= StatusEnum.accepted.value).all():
+    if min_status >= StatusEnum.accepted.value:
         return StatusEnum.accepted
-    if (job_status >= StatusEnum.reviewable.value).all():
+    if min_status >= StatusEnum.reviewable.value:
         return StatusEnum.reviewable
-    if (job_status >= StatusEnum.completed.value).all():
+    if min_status >= StatusEnum.completed.value:
         return StatusEnum.completed
-    if (job_status < 0).any():
+    if min_status < 0:
         return StatusEnum.failed
-    if (job_status >= StatusEnum.running.value).any():
+    max_status = job_status.max()
+    if max_status >= StatusEnum.running.value:
         return StatusEnum.running
-    if (job_status >= StatusEnum.prepared.value).any():
+    if max_status >= StatusEnum.prepared.value:
         return StatusEnum.prepared
     return StatusEnum.ready
 
 
 def check_scripts(dbi: DbInterface, entry: Any, script_type: ScriptType) -> None:
     """Check the status all the scripts of a given type"""
-    for script in entry.all_scripts_:
-        if script.script_type != script_type:
-            continue
-        if script.superseded:
-            continue
+    sel = select(Script).where(
+        and_(
+            with_parent(entry, type(entry).all_scripts_),
+            Script.script_type == script_type,
+            Script.superseded.isnot(True),
+        )
+    )
+    for script in dbi.connection().execute(sel).scalars().all():
         Script.check_status(dbi, script)
     dbi.connection().commit()
 
 
 def check_jobs(dbi: DbInterface, entry: Any) -> None:
     """Check the status of a set of jobs"""
-    for job in entry.jobs_:
-        if job.superseded:
-            continue
+    sel = select(Job).where(
+        and_(
+            with_parent(entry, type(entry).jobs_),
+            Job.superseded.isnot(True),
+        )
+    )
+    for job in dbi.connection().execute(sel).scalars().all():
         Job.check_status(dbi, job)
     dbi.connection().commit()
 
@@ -167,7 +185,8 @@ def check_prepared_entry(dbi: DbInterface, entry: Any) -> bool:
 def check_populating_entry(dbi: DbInterface, entry: Any) -> bool:
     """Check a populating entry for movement to running."""
     current_status = entry.status
-    new_status = extract_child_status(entry.children(), StatusEnum.populating, StatusEnum.running)
+    status_counts = dbi.count_child_status(entry.level, entry.db_id)
+    new_status = extract_child_status(status_counts, StatusEnum.populating, StatusEnum.running)
     if current_status != new_status:
         entry.update_values(dbi, entry.id, status=new_status)
         return True
@@ -180,7 +199,8 @@ def check_running_entry(dbi: DbInterface, entry: Any) -> bool:
     if entry.level == LevelEnum.workflow:
         new_status = extract_job_status(entry.jobs_)
     else:
-        new_status = extract_completion_status(entry.children(), StatusEnum.running, StatusEnum.collectable)
+        status_counts = dbi.count_child_status(entry.level, entry.db_id)
+        new_status = extract_completion_status(status_counts, StatusEnum.running, StatusEnum.collectable)
     if current_status != new_status:
         entry.update_values(dbi, entry.id, status=new_status)
         return True
@@ -285,23 +305,17 @@ def check_entry_loop(dbi: DbInterface, entry: Any) -> bool:
 
 def accept_jobs(dbi: DbInterface, jobs: Iterable, rescuable: bool = False) -> None:
     """Make all the scripts associated with an entry as accepted"""
-    for job in jobs:
-        if job.superseded:
-            continue
-        if job.status != StatusEnum.reviewable:
-            continue
-        if rescuable:
-            job.update_values(dbi, job.id, status=StatusEnum.rescuable)
-        else:
-            job.update_values(dbi, job.id, status=StatusEnum.accepted)
+    job_ids = [job.id for job in jobs if not job.superseded and job.status == StatusEnum.reviewable]
+    if rescuable:
+        Job.update_many(dbi, job_ids, status=StatusEnum.rescuable)
+    else:
+        Job.update_many(dbi, job_ids, status=StatusEnum.accepted)
 
 
 def accept_scripts(dbi: DbInterface, scripts: Iterable) -> None:
     """Make all the scripts associated with an entry as accepted"""
-    for script in scripts:
-        # accept_scripts should only be called on completed scripts
-        # assert script.status == StatusEnum.completed
-        script.update_values(dbi, script.id, status=StatusEnum.accepted)
+    # accept_scripts should only be called on completed scripts
+    Script.update_many(dbi, [script.id for script in scripts], status=StatusEnum.accepted)
 
 
 def accept_entry(dbi: DbInterface, handler: Handler, entry: Any, rescuable: bool = False) -> list[DbId]:
@@ -384,6 +398,47 @@ def rollback_children(
     return db_id_list
 
 
+def _rollback_validate_scripts(dbi: DbInterface, handler: Handler, entry: Any, purge: bool) -> list[DbId]:
+    """Rollback step for a `completed` entry"""
+    rollback_scripts(dbi, entry, ScriptType.validate, purge)
+    return []
+
+
+def _rollback_collect_scripts(dbi: DbInterface, handler: Handler, entry: Any, purge: bool) -> list[DbId]:
+    """Rollback step for a `collectable` entry"""
+    rollback_scripts(dbi, entry, ScriptType.collect, purge)
+    return []
+
+
+def _rollback_populating(dbi: DbInterface, handler: Handler, entry: Any, purge: bool) -> list[DbId]:
+    """Rollback step for a `populating` entry"""
+    rollback_jobs(dbi, entry, purge)
+    return handler.rollback_subs(dbi, entry, StatusEnum.prepared, purge)
+
+
+def _rollback_children(dbi: DbInterface, handler: Handler, entry: Any, purge: bool) -> list[DbId]:
+    """Rollback step for a `prepared` entry"""
+    supersede_children(dbi, entry.children(), purge)
+    return []
+
+
+def _rollback_prepare_scripts(dbi: DbInterface, handler: Handler, entry: Any, purge: bool) -> list[DbId]:
+    """Rollback step for a `ready` entry"""
+    rollback_scripts(dbi, entry, ScriptType.prepare, purge)
+    return []
+
+
+# Maps the status value being rolled back through
+# to the function that undoes that step
+rollback_step_map = {
+    StatusEnum.completed.value: _rollback_validate_scripts,
+    StatusEnum.collectable.value: _rollback_collect_scripts,
+    StatusEnum.populating.value: _rollback_populating,
+    StatusEnum.prepared.value: _rollback_children,
+    StatusEnum.ready.value: _rollback_prepare_scripts,
+}
+
+
 def rollback_entry(
     dbi: DbInterface, handler: Handler, entry: Any, to_status: StatusEnum, purge: bool = False
 ) -> list[DbId]:
@@ -394,19 +449,10 @@ def rollback_entry(
     db_id_list: list[DbId] = []
     if status_val <= to_status.value:
         return db_id_list
-    while status_val >= to_status.value:
-        if status_val == StatusEnum.completed.value:
-            rollback_scripts(dbi, entry, ScriptType.validate, purge)
-        elif status_val == StatusEnum.collectable.value:
-            rollback_scripts(dbi, entry, ScriptType.collect, purge)
-        elif status_val == StatusEnum.populating.value:
-            rollback_jobs(dbi, entry, purge)
-            db_id_list += handler.rollback_subs(dbi, entry, StatusEnum.prepared, purge)
-        elif status_val == StatusEnum.prepared.value:
-            supersede_children(dbi, entry.children(), purge)
-        elif status_val == StatusEnum.ready.value:
-            rollback_scripts(dbi, entry, ScriptType.prepare, purge)
-        status_val -= 1
+    for step_val in range(status_val, to_status.value - 1, -1):
+        rollback_step = rollback_step_map.get(step_val)
+        if rollback_step is not None:
+            db_id_list += rollback_step(dbi, handler, entry, purge)
     db_id_list.append(entry.db_id)
 
     entry.update_values(dbi, entry.id, status=to_status)
@@ -63,12 +63,13 @@ class Job(common.Base, common.SQLScriptMixin, ScriptBase):
 
     level = Column(Enum(LevelEnum))
     db_id: DbId = composite(DbId, p_id, c_id, s_id, g_id, w_id)
+    level_keys = (p_id, c_id, s_id, g_id, w_id)
     c_: Campaign = relationship("Campaign", back_populates="jobs_")
     s_: Step = relationship("Step", back_populates="jobs_")
     g_: Group = relationship("Group", back_populates="jobs_")
     w_: Workflow = relationship("Workflow", back_populates="jobs_")
     frag_: Fragment = relationship("Fragment", viewonly=True)
-    errors_: Iterable = relationship("ErrorInstance", back_populates="job_")
+    errors_: Iterable = relationship("ErrorInstance", back_populates="job_", order_by="ErrorInstance.id")
 
     def __repr__(self) -> str:
         if self.superseded:
@@ -1,19 +1,38 @@
+import copy
 import os
 import subprocess
+from functools import lru_cache
 from typing import Any
 
 import yaml
 
+from lsst.cm.tools.core.checker import Checker
 from lsst.cm.tools.core.db_interface import DbInterface, JobBase
 from lsst.cm.tools.core.handler import JobHandlerBase
-from lsst.cm.tools.core.panda_utils import PandaChecker
 from lsst.cm.tools.core.script_utils import RollbackRun, YamlChecker, make_bps_command, write_command_script
 from lsst.cm.tools.core.slurm_utils import submit_job
-from lsst.cm.tools.core.utils import ScriptMethod, StatusEnum
+from lsst.cm.tools.core.utils import ScriptMethod, StatusEnum, safe_load_yaml
 from lsst.cm.tools.db.job import Job
 from lsst.cm.tools.db.workflow import Workflow
 
 
+@lru_cache(maxsize=16)
+def _parse_bps_template(template_yaml: str, mtime: float) -> dict[str, Any]:
+    """Read and parse a bps yaml template, `mtime` is only used as cache key"""
+    with open(template_yaml, "rt", encoding="utf-8") as fin:
+        return safe_load_yaml(fin)
+
+
+def load_bps_template(template_yaml: str) -> dict[str, Any]:
+    """Return a fresh copy of the parsed bps yaml template
+
+    All the jobs in a campaign typically share a template,
+    so the parsed yaml is cached, keyed on the file modification
+    time so that edits to the template are picked up.
+    """
+    return copy.deepcopy(_parse_bps_template(template_yaml, os.stat(template_yaml).st_mtime))
+
+
 class JobHandler(JobHandlerBase):
     """Job callback handler
 
@@ -35,38 +54,50 @@ class JobHandler(JobHandlerBase):
         )
     )
 
+    # ScriptMethod.slurm falls back on PandaChecker in get_checker_class,
+    # so that the panda client stack is only imported for slurm jobs
     checker_class_dict = {
         ScriptMethod.fake_run: None,
         ScriptMethod.no_run: None,
         ScriptMethod.no_script: None,
         ScriptMethod.bash: YamlChecker,
-        ScriptMethod.slurm: PandaChecker,
     }
 
     rollback_class_name = RollbackRun().get_rollback_class_name()
 
+    def get_checker_class(self) -> type[Checker] | None:
+        """Return the class used to check jobs, given our script method"""
+        slurm = ScriptMethod.slurm
+        if self.script_method == slurm and slurm not in self.checker_class_dict:  # pragma: no cover
+            # deferred, the panda client stack is slow to import
+            from lsst.cm.tools.core.panda_utils import PandaChecker
+
+            return PandaChecker
+        return self.checker_class_dict[self.script_method]
+
     def insert(self, dbi: DbInterface, parent: Any, **kwargs: Any) -> JobBase:
         kwcopy = kwargs.copy()
         name = kwcopy.pop("name")
-        prev_jobs = [job for job in parent.jobs_ if job.name == name]
-        idx = len(prev_jobs)
-        checker_class = self.checker_class_dict[self.script_method]
+        idx = sum(1 for job in parent.jobs_ if job.name == name)
+        checker_class = self.get_checker_class()
         if checker_class is None:  # pragma: no cover
             checker_class_name = None
         else:
             checker_class_name = checker_class().get_checker_class_name()
+        parent_db_id = parent.db_id
+        root_coll = parent.c_.root_coll
         insert_fields = dict(
             name=name,
             idx=idx,
-            p_id=parent.db_id.p_id,
-            c_id=parent.db_id.c_id,
-            s_id=parent.db_id.s_id,
-            g_id=parent.db_id.g_id,
-            w_id=parent.db_id.w_id,
+            p_id=parent_db_id.p_id,
+            c_id=parent_db_id.c_id,
+            s_id=parent_db_id.s_id,
+            g_id=parent_db_id.g_id,
+            w_id=parent_db_id.w_id,
             frag_id=self._fragment_id,
             checker=checker_class_name,
             rollback=self.rollback_class_name,
-            coll_out=f"{parent.c_.root_coll}/{parent.fullname}_{idx:03}",
+            coll_out=f"{root_coll}/{parent.fullname}_{idx:03}",
             status=StatusEnum.ready,
             bps_yaml_template=self.get_config_var("bps_yaml_template", parent.bps_yaml_template, **kwcopy),
             bps_script_template=self.get_config_var(
@@ -80,7 +111,7 @@ class JobHandler(JobHandlerBase):
         )
         script_data = self.resolve_templated_strings(
             prod_base_url=parent.prod_base_url,
-            root_coll=parent.c_.root_coll,
+            root_coll=root_coll,
             fullname=parent.fullname,
             idx=idx,
             name=name,
@@ -99,19 +130,22 @@ class JobHandler(JobHandlerBase):
 
         outpath = job.config_url
 
-        with open(workflow_template_yaml, "rt", encoding="utf-8") as fin:
-            workflow_config = yaml.safe_load(fin)
+        workflow_config = load_bps_template(workflow_template_yaml)
+
+        campaign = parent.c_
+        production_name = parent.p_.name
+        campaign_fullname = f"{production_name}/{campaign.name}"
 
-        workflow_config["project"] = parent.p_.name
-        workflow_config["campaign"] = f"{parent.p_.name}/{parent.c_.name}"
+        workflow_config["project"] = production_name
+        workflow_config["campaign"] = campaign_fullname
         workflow_config["LSST_VERSION"] = job.lsst_version
         if job.lsst_custom_setup is not None:
             workflow_config["custom_lsst_setup"] = job.lsst_custom_setup
         workflow_config["pipelineYaml"] = job.pipeline_yaml
-        if parent.coll_in != parent.c_.coll_in:
-            inCollection = f"{parent.coll_in},{parent.c_.coll_ancil}"
+        if parent.coll_in != campaign.coll_in:
+            inCollection = f"{parent.coll_in},{campaign.coll_ancil}"
         else:
-            inCollection = f"{parent.c_.coll_in},{parent.c_.coll_ancil}"
+            inCollection = f"{campaign.coll_in},{campaign.coll_ancil}"
 
         if parent.get_handler().config.get("rescue", False):
             skip_cols = ""
@@ -128,7 +162,7 @@ class JobHandler(JobHandlerBase):
             inCollection = f"{skip_cols},{inCollection}"
 
         payload = dict(
-            payloadName=f"{parent.p_.name}/{parent.c_.name}",
+            payloadName=campaign_fullname,
             outputRun=job.coll_out,
             butlerConfig=butler_repo,
             inCollection=inCollection,
@@ -144,7 +178,7 @@ class JobHandler(JobHandlerBase):
         try:
             bps_script_template = os.path.expandvars(job.bps_script_template)
             with open(bps_script_template, "r") as fin:
-                prepend = fin.read().replace("{lsst_version}", parent.c_.lsst_version)
+                prepend = fin.read().replace("{lsst_version}", campaign.lsst_version)
         except KeyError:
             prepend = ""
 
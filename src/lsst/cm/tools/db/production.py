@@ -24,6 +24,8 @@ class Production(common.Base, common.CMTable):
     db_id: DbId = composite(DbId, id)
     c_: Iterable = relationship("Campaign", back_populates="p_")
 
+    # declarative mistakes a one element tuple for a stray comma,
+    # so this one stays a list
     match_keys = [id]
     parent_id = None
     parent_ = None
@@ -1,6 +1,8 @@
 import subprocess
 from typing import Any
 
+from sqlalchemy import select
+
 from lsst.cm.tools.core.db_interface import DbInterface, ScriptBase
 from lsst.cm.tools.core.handler import ScriptHandlerBase
 from lsst.cm.tools.core.script_utils import (
@@ -14,6 +16,7 @@ from lsst.cm.tools.core.script_utils import (
 )
 from lsst.cm.tools.core.slurm_utils import SlurmChecker, submit_job
 from lsst.cm.tools.core.utils import LevelEnum, ScriptMethod, ScriptType, StatusEnum
+from lsst.cm.tools.db import top
 from lsst.cm.tools.db.campaign import Campaign
 from lsst.cm.tools.db.script import Script
 
@@ -51,8 +54,7 @@ class ScriptHandler(ScriptHandlerBase):
     def insert(self, dbi: DbInterface, parent: Any, **kwargs: Any) -> ScriptBase:
         kwcopy = kwargs.copy()
         name = kwcopy.pop("name")
-        prev_scripts = [script for script in parent.scripts_ if script.name == name]
-        idx = len(prev_scripts)
+        idx = sum(1 for script in parent.scripts_ if script.name == name)
         checker_class = self.checker_class_dict[self.script_method]
         if checker_class is None:  # pragma: no cover
             checker_class_name = None
@@ -171,8 +173,19 @@ class CollectScriptHandler(ScriptHandler):
     script_type: ScriptType = ScriptType.collect
 
     def write_script_hook(self, dbi: DbInterface, parent: Any, script: ScriptBase, **kwargs: Any) -> None:
-        input_colls = [child.coll_out for child in parent.children() if not child.superseded]
-        input_colls.reverse()
+        # Only the output collection names are needed, so select that
+        # column directly instead of loading every child entry
+        child_level = parent.level.child()
+        if child_level is None:
+            input_colls = []
+        else:
+            child_table = top.get_table_for_level(child_level)
+            sel = (
+                select(child_table.coll_out)
+                .where(child_table.parent_id == parent.id, child_table.superseded.isnot(True))
+                .order_by(child_table.id.desc())
+            )
+            input_colls = dbi.connection().execute(sel).scalars().all()
         command = make_butler_chain_command(parent.butler_repo, parent.coll_out, input_colls)
         write_command_script(script, command, **kwargs)
 
@@ -1,19 +1,27 @@
 import os
 import re
 import sys
+from collections import Counter, defaultdict
 from contextlib import nullcontext
+from functools import lru_cache
 from time import sleep
 from typing import Any, Iterable, Optional, TextIO
 
-import yaml
 from sqlalchemy import and_, func, select, update
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, selectinload, with_parent
 
 from lsst.cm.tools.core.butler_utils import butler_associate_kludge, print_dataset_summary
 from lsst.cm.tools.core.db_interface import CMTableBase, ConfigBase, DbInterface, JobBase, ScriptBase
 from lsst.cm.tools.core.dbid import DbId
 from lsst.cm.tools.core.handler import Handler
-from lsst.cm.tools.core.utils import LevelEnum, ScriptMethod, ScriptType, StatusEnum, TableEnum
+from lsst.cm.tools.core.utils import (
+    LevelEnum,
+    ScriptMethod,
+    ScriptType,
+    StatusEnum,
+    TableEnum,
+    safe_load_yaml,
+)
 from lsst.cm.tools.db import common, top
 from lsst.cm.tools.db.config import Config, ConfigAssociation, Fragment
 from lsst.cm.tools.db.dependency import Dependency
@@ -21,6 +29,63 @@ from lsst.cm.tools.db.error_table import ErrorAction, ErrorFlavor, ErrorInstance
 from lsst.cm.tools.db.job import Job
 from lsst.cm.tools.db.production import Production
 from lsst.cm.tools.db.script import Script
+from lsst.cm.tools.db.workflow import Workflow
+
+# Maps the type of a script that is being rerun
+# to the status its parent entry should go back to
+rerun_parent_status_map = {
+    ScriptType.prepare: StatusEnum.preparing,
+    ScriptType.collect: StatusEnum.collecting,
+    ScriptType.validate: StatusEnum.validating,
+}
+
+# Job and script states that fake_run and fake_script act on
+fake_run_job_states = frozenset([StatusEnum.prepared, StatusEnum.running])
+fake_run_script_states = frozenset([StatusEnum.ready, StatusEnum.prepared, StatusEnum.running])
+
+# The keyword arguments get_db_id looks for, from the top level down
+db_id_name_keys = ("production_name", "campaign_name", "step_name", "group_name", "workflow_idx")
+
+# Job states that launch_jobs needs to see
+launch_job_states = frozenset([StatusEnum.prepared, StatusEnum.running])
+
+# Failed and rejected states, the ones requeue_jobs acts on
+bad_states = frozenset(status for status in StatusEnum if status.bad())
+
+# States that stop the daemon loop
+terminal_states = frozenset([StatusEnum.failed, StatusEnum.rejected, StatusEnum.reviewable])
+
+
+@lru_cache(maxsize=256)
+def _split_fullname(fullname: str) -> tuple[tuple[str, str], ...]:
+    """Split a fullname into (name_key, name) pairs, from the top down
+
+    Scripts and the daemon resolve the same fullnames over and over,
+    so the split is cached.  A tuple is returned so that the cached
+    value can not be modified by callers.
+    """
+    tokens = fullname.split("/")
+    names = list(zip(db_id_name_keys, tokens))
+    if len(names) == len(db_id_name_keys):
+        # this strip helps with internal database
+        # calls
+        names[-1] = (names[-1][0], names[-1][1].strip("w"))
+    return tuple(names)
+
+
+def _compile_error_types(error_types: list[ErrorType]) -> list[tuple[re.Pattern, ErrorType]]:
+    """Compile the diagnostic message patterns of some error types
+
+    Error types with a missing or malformed pattern are reported
+    and skipped, so that they do not stop the other errors being matched
+    """
+    patterns = []
+    for error_type_ in error_types:
+        try:
+            patterns.append((re.compile(error_type_.diagnostic_message.strip()), error_type_))
+        except (AttributeError, re.error) as msg:
+            print(f"Skipping error type {error_type_.error_name}, bad diagnostic message: {msg}")
+    return patterns
 
 
 class SQLAlchemyInterface(DbInterface):
@@ -29,6 +94,10 @@ class SQLAlchemyInterface(DbInterface):
     def __init__(self, db_url: str, **kwargs: Any):
         self._engine = top.build_engine(db_url, **kwargs)
         self._conn = Session(self._engine, future=True)
+        # names -> primary keys, for _get_db_id_from_names
+        self._id_cache: dict[tuple[str, ...], tuple[int, ...]] = {}
+        # config name -> Config, for get_config
+        self._config_cache: dict[str, Config] = {}
         DbInterface.__init__(self)
 
     def connection(self) -> Session:
@@ -38,53 +107,48 @@ class SQLAlchemyInterface(DbInterface):
         fullname = kwargs.get("fullname")
         if fullname is not None:
             return self._get_db_id_from_fullname(fullname)
-        return self._get_db_id_in_steps(**kwargs)
+        # Collect names from the top down, stopping at the first missing one
+        names: list[Any] = []
+        for name_key in db_id_name_keys:
+            name = kwargs.get(name_key)
+            if name is None:
+                break
+            names.append(name)
+        return self._get_db_id_from_names(names)
 
-    def _get_db_id_in_steps(self, **kwargs: Any) -> DbId:
-        p_name = kwargs.get("production_name")
-        p_id = self._get_id(LevelEnum.production, None, p_name)
-        if p_id is None:
+    def _get_db_id_from_names(self, names: list[Any]) -> DbId:
+        """Returns the DbId for a list of names, from production downwards"""
+        if not names:
+            return DbId()
+        if len(names) == len(db_id_name_keys):
+            names[-1] = f"{names[-1]:02}"
+        cache_key = tuple(names)
+        cached_ids = self._id_cache.get(cache_key)
+        if cached_ids is not None:
+            return DbId(*cached_ids)
+        # Resolve every level in one round trip, the outer joins leave
+        # the ids below the first level that fails to match as NULL
+        tables = [top.get_table_for_level(level) for level in list(LevelEnum)[: len(names)]]
+        sel = select(*[table.id for table in tables])
+        for parent_table, table, name in zip(tables, tables[1:], names[1:]):
+            sel = sel.outerjoin(table, and_(table.parent_id == parent_table.id, table.name == name))
+        sel = sel.where(tables[0].name == names[0])
+        row = self.connection().execute(sel).first()
+        if row is None:
             return DbId()
-        c_name = kwargs.get("campaign_name")
-        if c_name is None:
-            return DbId(p_id=p_id)
-        c_id = self._get_id(LevelEnum.campaign, p_id, c_name)
-        s_name = kwargs.get("step_name")
-        if s_name is None:
-            return DbId(p_id=p_id, c_id=c_id)
-        s_id = self._get_id(LevelEnum.step, c_id, s_name)
-        g_name = kwargs.get("group_name")
-        if g_name is None:
-            return DbId(p_id=p_id, c_id=c_id, s_id=s_id)
-        g_id = self._get_id(LevelEnum.group, s_id, g_name)
-        w_idx = kwargs.get("workflow_idx")
-        if w_idx is None:
-            return DbId(p_id=p_id, c_id=c_id, s_id=s_id, g_id=g_id)
-        w_id = self._get_id(LevelEnum.workflow, g_id, f"{w_idx:02}")
-        return DbId(p_id=p_id, c_id=c_id, s_id=s_id, g_id=g_id, w_id=w_id)
+        ids = tuple(row)
+        # Entries are never renamed or deleted, so complete matches are
+        # cached.  Partial ones are not, the entry might be added later.
+        if None not in ids:
+            self._id_cache[cache_key] = ids
+        return DbId(*ids)
 
     @staticmethod
     def parse_fullname(fullname: str) -> dict[str, str]:
-        tokens = fullname.split("/")
-        n_tokens = len(tokens)
-        names = {}
-        if n_tokens >= 1:
-            names["production_name"] = tokens[0]
-        if n_tokens >= 2:
-            names["campaign_name"] = tokens[1]
-        if n_tokens >= 3:
-            names["step_name"] = tokens[2]
-        if n_tokens >= 4:
-            names["group_name"] = tokens[3]
-        if n_tokens >= 5:
-            # this strip helps with internal database
-            # calls
-            names["workflow_idx"] = tokens[4].strip("w")
-        return names
+        return dict(_split_fullname(fullname))
 
     def _get_db_id_from_fullname(self, fullname: str) -> DbId:
-        names = self.parse_fullname(fullname)
-        return self._get_db_id_in_steps(**names)
+        return self._get_db_id_from_names([name for _, name in _split_fullname(fullname)])
 
     def get_entry_from_fullname(self, fullname: str) -> DbId:
         n_slash = fullname.count("/")
@@ -111,14 +175,40 @@ class SQLAlchemyInterface(DbInterface):
 
     def get_entry(self, level: LevelEnum, db_id: DbId) -> CMTableBase:
         table = top.get_table_for_level(level)
-        sel = select(table).where(table.id == db_id[table.level])
-        entry = common.return_first_column(self, sel)
+        row_id = db_id[table.level]
+        # Session.get checks the identity map before going to the database,
+        # so repeated lookups of the same entry do not issue new queries
+        entry = None if row_id is None else self.connection().get(table, row_id)
         self._verify_entry(entry, level, db_id)
         return entry
 
+    def count_child_status(self, level: LevelEnum, db_id: DbId) -> dict[StatusEnum, int]:
+        child_level = level.child()
+        if child_level is None:
+            return {}
+        table = top.get_table_for_level(child_level)
+        sel = (
+            select(table.status, func.count(table.id))
+            .where(
+                and_(
+                    table.parent_id == db_id[level],
+                    table.superseded.isnot(True),
+                )
+            )
+            .group_by(table.status)
+        )
+        return {status: count for status, count in self.connection().execute(sel)}
+
     def get_config(self, config_name: str) -> ConfigBase:
+        # Only hits are cached, configs are never removed
+        config = self._config_cache.get(config_name)
+        if config is not None:
+            return config
         sel = select(Config).where(Config.name == config_name)
-        return common.return_first_column(self, sel)
+        config = common.return_first_column(self, sel)
+        if config is not None:
+            self._config_cache[config_name] = config
+        return config
 
     def get_matching(self, level: LevelEnum, entry: CMTableBase, status: StatusEnum) -> Iterable:
         table = top.get_table_for_level(level)
@@ -262,11 +352,8 @@ class SQLAlchemyInterface(DbInterface):
         fullname = kwcopy.pop("fullname", None)
         if fullname is None:
             fullname = last_workflow.fullname
-        production_name, campaign_name, step_name, group_name = fullname.split("/")[0:4]
-        kwcopy["production_name"] = production_name
-        kwcopy["campaign_name"] = campaign_name
-        kwcopy["step_name"] = step_name
-        kwcopy["group_name"] = group_name
+        # the names down to the group level come from the fullname
+        kwcopy.update(zip(db_id_name_keys[:4], fullname.split("/")[0:4], strict=True))
         new_entry = handler.insert(
             self,
             parent,
@@ -311,14 +398,8 @@ class SQLAlchemyInterface(DbInterface):
         return new_job
 
     def queue_jobs(self, level: LevelEnum, db_id: DbId) -> list[DbId]:
-        entry = self.get_entry(level, db_id)
         db_id_list = []
-        for job_ in entry.jobs_:
-            status = job_.status
-            if status != StatusEnum.ready:
-                continue
-            if job_.superseded:
-                continue
+        for job_ in self._get_jobs(level, db_id, Job.status == StatusEnum.ready, Job.superseded.isnot(True)):
             db_id_list.append(job_.db_id)
             handler = job_.get_handler()
             parent = job_.w_
@@ -330,8 +411,6 @@ class SQLAlchemyInterface(DbInterface):
 
     def launch_jobs(self, level: LevelEnum, db_id: DbId, max_running: int) -> list[DbId]:
         db_id_list: list[DbId] = []
-        entry = self.get_entry(level, db_id)
-        handler = entry.get_handler()
         n_running = 0
         # This is what we actually want, but _count_jobs_at_status
         # isn't working correctly under some cases now, so I've
@@ -340,12 +419,11 @@ class SQLAlchemyInterface(DbInterface):
         # n_running = self._count_jobs_at_status(StatusEnum.running)
         # if n_running >= max_running:
         #    return db_id_list
-        for job_ in entry.jobs_:
+        job_list = self._get_jobs(level, db_id, Job.status.in_(launch_job_states), Job.superseded.isnot(True))
+        for job_ in job_list:
             if n_running >= max_running:
                 break
             status = job_.status
-            if job_.superseded:
-                continue
             if status == StatusEnum.running:
                 n_running += 1
             if status != StatusEnum.prepared:
@@ -360,14 +438,7 @@ class SQLAlchemyInterface(DbInterface):
 
     def requeue_jobs(self, level: LevelEnum, db_id: DbId) -> list[DbId]:
         db_id_list: list[DbId] = []
-        entry = self.get_entry(level, db_id)
-        handler = entry.get_handler()
-        for job_ in entry.jobs_:
-            status = job_.status
-            if not status.bad():
-                continue
-            if job_.superseded:
-                continue
+        for job_ in self._get_jobs(level, db_id, Job.status.in_(bad_states), Job.superseded.isnot(True)):
             workflow = job_.w_
             Job.update_values(self, job_.id, superseded=True)
             handler = workflow.get_handler()
@@ -386,11 +457,6 @@ class SQLAlchemyInterface(DbInterface):
     ) -> list[DbId]:
         db_id_list: list[DbId] = []
         entry = self.get_entry(level, db_id)
-        parent_status_map = {
-            ScriptType.prepare: StatusEnum.preparing,
-            ScriptType.collect: StatusEnum.collecting,
-            ScriptType.validate: StatusEnum.validating,
-        }
         for script_ in entry.all_scripts_:
             status = script_.status
             if script_.superseded:
@@ -404,7 +470,7 @@ class SQLAlchemyInterface(DbInterface):
             handler = parent.get_handler()
             handler.rerun_script(self, parent, script_name, script_.script_type)
             script_.update_values(self, script_.id, status=StatusEnum.running)
-            parent.update_values(self, parent.id, status=parent_status_map[script_.script_type])
+            parent.update_values(self, parent.id, status=rerun_parent_status_map[script_.script_type])
             db_id_list.append(parent.db_id)
         self.connection().commit()
         self.check(level, db_id)
@@ -463,12 +529,8 @@ class SQLAlchemyInterface(DbInterface):
         return db_id_list
 
     def fake_run(self, level: LevelEnum, db_id: DbId, status: StatusEnum = StatusEnum.completed) -> list[int]:
-        entry = self.get_entry(level, db_id)
         db_id_list: list[int] = []
-        for job_ in entry.jobs_:
-            old_status = job_.status
-            if old_status not in [StatusEnum.prepared, StatusEnum.running]:
-                continue
+        for job_ in self._get_jobs(level, db_id, Job.status.in_(fake_run_job_states)):
             handler = job_.get_handler()
             handler.fake_run_hook(self, job_, status)
             db_id_list.append(job_.id)
@@ -481,12 +543,14 @@ class SQLAlchemyInterface(DbInterface):
     ) -> list[int]:
         entry = self.get_entry(level, db_id)
         db_id_list: list[int] = []
-        for script_ in entry.scripts_:
-            if script_.name != script_name:
-                continue
-            old_status = script_.status
-            if old_status not in [StatusEnum.ready, StatusEnum.prepared, StatusEnum.running]:
-                continue
+        sel = select(Script).where(
+            and_(
+                with_parent(entry, type(entry).scripts_),
+                Script.name == script_name,
+                Script.status.in_(fake_run_script_states),
+            )
+        )
+        for script_ in self.connection().execute(sel).scalars().all():
             handler = script_.get_handler()
             handler.fake_run_hook(self, script_, status)
             db_id_list.append(script_.id)
@@ -562,15 +626,9 @@ class SQLAlchemyInterface(DbInterface):
             if Handler.script_method == ScriptMethod.fake_run:
                 self.fake_run(LevelEnum.campaign, db_id)
             if verbose:
-                with open(log_file, "a") if log_file else nullcontext(sys.stdout) as log_stream:
-                    self.print_table(log_stream, TableEnum.step)
-                    self.print_table(log_stream, TableEnum.group)
-                    self.print_table(log_stream, TableEnum.workflow)
+                self._log_tables(log_file)
             if self._check_terminal_state(LevelEnum.campaign, db_id):
-                with open(log_file, "a") if log_file else nullcontext(sys.stdout) as log_stream:
-                    self.print_table(log_stream, TableEnum.step)
-                    self.print_table(log_stream, TableEnum.group)
-                    self.print_table(log_stream, TableEnum.workflow)
+                self._log_tables(log_file)
                 break
             i_iter -= 1
             sleep(sleep_time)
@@ -581,46 +639,39 @@ class SQLAlchemyInterface(DbInterface):
 
     def load_error_types(self, config_yaml: str) -> None:
         with open(config_yaml, "rt", encoding="utf-8") as config_file:
-            config_data = yaml.safe_load(config_file)
+            config_data = safe_load_yaml(config_file)
         conn = self.connection()
         error_code_dict = config_data["pandaErrorCode"]
+        # bind the lookups once, rather than going through
+        # the Enum metaclass for every error type
+        flavors = ErrorFlavor.__members__
+        default_action = ErrorAction.failed_review
+        existing_ids = dict(conn.execute(select(ErrorType.error_name, ErrorType.id)).all())
         for key, val in error_code_dict.items():
             for error_name, error_type in val.items():
-                matched_id = conn.query(ErrorType.id).filter_by(error_name=error_name).first()
-                if matched_id is not None:
-                    stmt = (
-                        update(ErrorType)
-                        .where(ErrorType.id == matched_id[0])
-                        .values(
-                            panda_err_code=key,
-                            diagnostic_message=error_type["diagMessage"],
-                            jira_ticket=str(error_type["ticket"]),
-                            pipetask=error_type["pipetask"],
-                            is_resolved=error_type["resolved"],
-                            is_rescueable=error_type["rescue"],
-                            error_flavor=ErrorFlavor[error_type["flavor"]],
-                            action=ErrorAction["failed_review"],
-                            max_intensity=error_type["intensity"],
-                        )
-                    )
-                    conn.execute(stmt)
-                    conn.commit()
-                    continue
-                new_error_type = ErrorType(
-                    error_name=error_name,
+                # the same values are used to update or to insert
+                error_values = dict(
                     panda_err_code=key,
                     diagnostic_message=error_type["diagMessage"],
                     jira_ticket=str(error_type["ticket"]),
                     pipetask=error_type["pipetask"],
                     is_resolved=error_type["resolved"],
                     is_rescueable=error_type["rescue"],
-                    error_flavor=ErrorFlavor[error_type["flavor"]],
-                    action=ErrorAction["failed_review"],
+                    error_flavor=flavors[error_type["flavor"]],
+                    action=default_action,
                     max_intensity=error_type["intensity"],
                 )
+                matched_id = existing_ids.get(error_name)
+                if matched_id is not None:
+                    stmt = update(ErrorType).where(ErrorType.id == matched_id).values(**error_values)
+                    conn.execute(stmt)
+                    conn.commit()
+                    continue
+                new_error_type = ErrorType(error_name=error_name, **error_values)
                 try:
                     conn.add(new_error_type)
                     conn.commit()
+                    existing_ids[error_name] = new_error_type.id
                 except Exception:
                     print(f"Avoiding duplicate error entry {error_name}")
 
@@ -650,12 +701,26 @@ class SQLAlchemyInterface(DbInterface):
 
     def rematch_errors(self) -> Any:
         conn = self.connection()
-        unmatched_errors = conn.execute(select(ErrorInstance))
+        # Load the error types once, rather than querying them again
+        # for every error.  The patterns for a panda code are compiled
+        # the first time an error with that code is seen.
+        error_types_by_code: dict[str, list[ErrorType]] = defaultdict(list)
+        for error_type_ in conn.execute(select(ErrorType)).scalars():
+            error_types_by_code[error_type_.panda_err_code].append(error_type_)
+        patterns_by_code: dict[str, list[tuple[re.Pattern, ErrorType]]] = {}
+        unmatched_errors = conn.execute(select(ErrorInstance)).all()
         for unmatched_error_ in unmatched_errors:
-            error_type = self.match_error_type(
-                unmatched_error_[0].panda_err_code,
-                unmatched_error_[0].diagnostic_message,
-            )
+            panda_code = unmatched_error_[0].panda_err_code.strip()
+            possible_matches = patterns_by_code.get(panda_code)
+            if possible_matches is None:
+                possible_matches = _compile_error_types(error_types_by_code.get(panda_code, []))
+                patterns_by_code[panda_code] = possible_matches
+            diag_message = unmatched_error_[0].diagnostic_message.strip()
+            error_type = None
+            for pattern, possible_match_ in possible_matches:
+                if pattern.match(diag_message):
+                    error_type = possible_match_
+                    break
             if error_type is None:
                 print(
                     f"Unknown {unmatched_error_[0].panda_err_code} {unmatched_error_[0].diagnostic_message}"
@@ -672,28 +737,25 @@ class SQLAlchemyInterface(DbInterface):
 
     def match_file_errors(self, config_yaml: str, error_yaml: str) -> None:
         with open(config_yaml, "rt", encoding="utf-8") as config_file:
-            config_data = yaml.safe_load(config_file)
+            config_data = safe_load_yaml(config_file)
         with open(error_yaml, "rt", encoding="utf-8") as error_file:
-            error_data = yaml.safe_load(error_file)
+            error_data = safe_load_yaml(error_file)
 
         error_type_dict = config_data["pandaErrorCode"]
-        match_dict = {}
+        match_counts: Counter = Counter()
         unmatched_list = []
-        for key, val in error_data.items():
+        for val in error_data.values():
             matched = self.match_error_type_against_dict(
                 error_type_dict, val["panda_err_code"], val["diagMessage"]
             )
             if matched is not None:
-                if matched in match_dict:
-                    match_dict[matched].append((key))
-                else:
-                    match_dict[matched] = [key]
+                match_counts[matched] += 1
             else:
                 unmatched_list.append(val["panda_err_code"] + "  " + val["diagMessage"])
 
         print("Matched Errors")
-        for key, val in match_dict.items():
-            print(f"{key}, {len(val)}")
+        for key, count in match_counts.items():
+            print(f"{key}, {count}")
 
         print("Unmatched Errors")
         for err_ in sorted(unmatched_list):
@@ -703,37 +765,42 @@ class SQLAlchemyInterface(DbInterface):
         review_only = kwargs.get("review", False)
         summary_only = kwargs.get("summary", False)
         yaml_output = kwargs.get("yaml_output", False)
-        entry = self.get_entry(level, db_id)
-        error_dict = {}
-        for job_ in entry.jobs_:
+        # this checks that the entry exists
+        self.get_entry(level, db_id)
+        if not yaml_output:
+            stream.write("~Here are the errors!~\n")
+        if not self.count_errors(level, db_id):
+            return
+        if summary_only and not yaml_output:
+            self._report_error_summary(stream, level, db_id, review_only)
+            return
+        # raiseload makes any relationship that is not loaded up front
+        # fail loudly, instead of quietly issuing one query per job
+        sel = (
+            select(Job)
+            .where(Job.level_keys[level.value] == db_id[level])
+            .options(selectinload(Job.errors_), selectinload(Job.w_), raiseload("*", sql_only=True))
+        )
+        error_dict: dict[str | None, list] = defaultdict(list)
+        for job_ in self.connection().execute(sel).scalars():
             if review_only:
                 if job_.w_.status != StatusEnum.reviewable:
                     continue
             for err_ in job_.errors_:
-                try:
-                    error_dict[err_.error_name].append(err_)
-                except KeyError:
-                    error_dict[err_.error_name] = [err_]
-        if not yaml_output:
-            stream.write("~Here are the errors!~\n")
+                error_dict[err_.error_name].append((job_, err_))
         for error_name, error_list in error_dict.items():
             if not yaml_output:
-                stream.write(f"Error: {error_name}")
-                if summary_only:
-                    stream.write(f":  {len(error_list)}\n")
-                    continue
-                else:
-                    stream.write("\n")
+                stream.write(f"Error: {error_name}\n")
             truncate_limit = 10
             if error_name is None:
                 truncate_limit = 1000
-            for i, err in enumerate(error_list):
+            for i, (job_, err) in enumerate(error_list):
                 if not yaml_output:
                     if i > truncate_limit:
                         stream.write(f"\tTruncating list at {truncate_limit}\n")
                         break
                     stream.write(
-                        f"""\tJob: {err.job_.w_.fullname}:{err.job_.idx}\t\t
+                        f"""\tJob: {job_.w_.fullname}:{job_.idx}\t\t
                         Pipetask: {err.pipetask}\n
                         Diag Message: {err.diagnostic_message}\n"""
                     )
@@ -753,6 +820,45 @@ class SQLAlchemyInterface(DbInterface):
     intensity: 0\n"""
                     )
 
+    def _report_error_summary(self, stream: TextIO, level: LevelEnum, db_id: DbId, review_only: bool) -> None:
+        """Print the number of errors of each name, counted in the database
+
+        Names are listed in the order of their first occurrence,
+        going through the jobs and then the errors of each job
+        """
+        by_name = dict(partition_by=ErrorInstance.error_name)
+        occurrences = (
+            select(
+                ErrorInstance.error_name,
+                func.count(ErrorInstance.id).over(**by_name).label("n_errors"),
+                func.row_number().over(**by_name, order_by=(Job.id, ErrorInstance.id)).label("rank"),
+                Job.id.label("job_id"),
+                ErrorInstance.id.label("error_id"),
+            )
+            .select_from(ErrorInstance)
+            .join(Job)
+            .where(Job.level_keys[level.value] == db_id[level])
+        )
+        if review_only:
+            occurrences = occurrences.join(Workflow).where(Workflow.status == StatusEnum.reviewable)
+        first = occurrences.subquery()
+        sel = (
+            select(first.c.error_name, first.c.n_errors)
+            .where(first.c.rank == 1)
+            .order_by(first.c.job_id, first.c.error_id)
+        )
+        for error_name, n_errors in self.connection().execute(sel):
+            stream.write(f"Error: {error_name}:  {n_errors}\n")
+
+    def count_errors(self, level: LevelEnum, db_id: DbId) -> int:
+        sel = (
+            select(func.count(ErrorInstance.id))
+            .select_from(ErrorInstance)
+            .join(Job)
+            .where(Job.level_keys[level.value] == db_id[level])
+        )
+        return self.connection().execute(sel).scalar_one()
+
     def commit_errors(self, job_id: int, errors_aggregate: Any) -> None:
         conn = self.connection()
         for jeditaskid, error_list in errors_aggregate.items():
@@ -775,19 +881,23 @@ class SQLAlchemyInterface(DbInterface):
             raise ValueError(
                 f"Unknown error: {error_name}.   Do cm print-table --table error_type to see known errors"
             )
-        error_dict = {}
-        for instance_ in error_type.instances_:
-            workflow_name = instance_.job_.w_.fullname
-            if workflow_name in error_dict:
-                error_dict[workflow_name] += 1
-            else:
-                error_dict[workflow_name] = 1
-        for key, val in error_dict.items():
-            stream.write(f"{key} : {val}\n")
+        # count the instances per workflow in the database,
+        # listing the workflows in order of their first instance
+        sel = (
+            select(Workflow.fullname, func.count(ErrorInstance.id))
+            .select_from(ErrorInstance)
+            .join(Job)
+            .join(Workflow)
+            .where(ErrorInstance.error_type_id == error_type.id)
+            .group_by(Workflow.id)
+            .order_by(func.min(ErrorInstance.id))
+        )
+        for workflow_name, n_errors in conn.execute(sel):
+            stream.write(f"{workflow_name} : {n_errors}\n")
 
     def extend_config(self, config_name: str, config_yaml: str) -> Config:
         conn = self.connection()
-        config = conn.execute(select(Config).where(Config.name == config_name)).scalar()
+        config = self.get_config(config_name)
         assert config is not None
         fragment_names = self._build_fragments(config_name, config_yaml, config)
         frag_list = [
@@ -807,7 +917,7 @@ class SQLAlchemyInterface(DbInterface):
         if Handler.config_dir is not None:
             config_yaml = os.path.join(Handler.config_dir, config_yaml)
         with open(config_yaml, "rt", encoding="utf-8") as config_file:
-            config_data = yaml.safe_load(config_file)
+            config_data = safe_load_yaml(config_file)
         conn = self.connection()
         n_frag = conn.query(func.count(Fragment.id)).scalar()
         frag_names = []
@@ -871,36 +981,33 @@ class SQLAlchemyInterface(DbInterface):
         conn.commit()
         return new_config
 
-    def _get_id(self, level: LevelEnum, parent_id: Optional[int], match_name: Optional[str]) -> Optional[int]:
-        """Returns the primary key matching the parent_id and the match_name"""
-        if match_name is None:
-            return None
-        table = top.get_table_for_level(level)
-        parent_field = table.parent_id
-        if parent_field is None:
-            sel = select(table.id).where(table.name == match_name)
-        else:
-            sel = select(table.id).where(and_(parent_field == parent_id, table.name == match_name))
-        return common.return_first_column(self, sel)
+    def _get_jobs(self, level: LevelEnum, db_id: DbId, *clauses: Any) -> list[Job]:
+        """Returns the jobs under an entry that pass the selection clauses"""
+        # this checks that the entry exists
+        self.get_entry(level, db_id)
+        sel = select(Job).where(and_(Job.level_keys[level.value] == db_id[level], *clauses))
+        return self.connection().execute(sel).scalars().all()
 
     def _verify_entry(self, entry: int | None, level: LevelEnum, db_id: DbId) -> None:
         if entry is None:  # pragma: no cover
             raise ValueError(f"Failed to get entry for {db_id} at {level.name}")
 
+    def _log_tables(self, log_file: Optional[str]) -> None:
+        """Print the step, group and workflow tables to the daemon log"""
+        with open(log_file, "a") if log_file else nullcontext(sys.stdout) as log_stream:
+            for which_table in (TableEnum.step, TableEnum.group, TableEnum.workflow):
+                self.print_table(log_stream, which_table)
+
     def _check_terminal_state(self, level: LevelEnum, db_id: DbId) -> bool:
         entry = self.get_entry(level, db_id)
-        terminal_states = [
-            StatusEnum.failed,
-            StatusEnum.rejected,
-            StatusEnum.reviewable,
-        ]
-        for script_ in entry.scripts_:
-            if script_.superseded:
-                continue
-            if script_.status in terminal_states:
-                return True
-        if entry.status in terminal_states:
-            return True
-        if entry.status == StatusEnum.accepted:
+        if entry.status in terminal_states or entry.status == StatusEnum.accepted:
             return True
-        return False
+        # look for a terminal script in SQL, rather than loading every script
+        sel = select(Script.id).where(
+            and_(
+                with_parent(entry, type(entry).scripts_),
+                Script.superseded.isnot(True),
+                Script.status.in_(terminal_states),
+            )
+        )
+        return self.connection().execute(sel.limit(1)).first() is not None
@@ -61,7 +61,7 @@ class Step(common.Base, common.CMTable):
     jobs_: Iterable = relationship("Job", back_populates="s_")
     depend_: Iterable = relationship("Dependency", back_populates="s_")
 
-    match_keys = [p_id, c_id, id]
+    match_keys = (p_id, c_id, id)
 
     @hybrid_property
     def butler_repo(self) -> Any:
@@ -100,8 +100,7 @@ class Step(common.Base, common.CMTable):
 
     def children(self) -> Iterable:
         """Maps self.g_ to self.children() for consistency"""
-        for group in self.g_:
-            yield group
+        return self.g_
 
     def sub_iterators(self) -> list[Iterable]:
         """Iterators over sub-entries, used for recursion"""
@@ -39,32 +39,37 @@ def build_engine(db_url: str, **kwargs: Any) -> Any:
     return engine
 
 
+# These map the enums onto the corresponding
+# table classes, they are built once at import
+level_tables = {
+    LevelEnum.production: Production,
+    LevelEnum.campaign: Campaign,
+    LevelEnum.step: Step,
+    LevelEnum.group: Group,
+    LevelEnum.workflow: Workflow,
+}
+
+all_tables = {
+    TableEnum.production: Production,
+    TableEnum.campaign: Campaign,
+    TableEnum.step: Step,
+    TableEnum.group: Group,
+    TableEnum.workflow: Workflow,
+    TableEnum.script: Script,
+    TableEnum.job: Job,
+    TableEnum.dependency: Dependency,
+    TableEnum.config: Config,
+    TableEnum.fragment: Fragment,
+    TableEnum.error_type: ErrorType,
+    TableEnum.error_instance: ErrorInstance,
+}
+
+
 def get_table_for_level(level: LevelEnum) -> Table:
     """Return the Table corresponding to a `level`"""
-    all_tables = {
-        LevelEnum.production: Production,
-        LevelEnum.campaign: Campaign,
-        LevelEnum.step: Step,
-        LevelEnum.group: Group,
-        LevelEnum.workflow: Workflow,
-    }
-    return all_tables[level]
+    return level_tables[level]
 
 
 def get_table(which_table: TableEnum) -> Table:
     """Return the Table corresponding to `which_table`"""
-    all_tables = {
-        TableEnum.production: Production,
-        TableEnum.campaign: Campaign,
-        TableEnum.step: Step,
-        TableEnum.group: Group,
-        TableEnum.workflow: Workflow,
-        TableEnum.script: Script,
-        TableEnum.job: Job,
-        TableEnum.dependency: Dependency,
-        TableEnum.config: Config,
-        TableEnum.fragment: Fragment,
-        TableEnum.error_type: ErrorType,
-        TableEnum.error_instance: ErrorInstance,
-    }
     return all_tables[which_table]
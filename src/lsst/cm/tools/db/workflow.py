@@ -64,7 +64,7 @@ class Workflow(common.Base, common.CMTable):
     jobs_: Iterable = relationship("Job", back_populates="w_")
     depend_: Iterable = relationship("Dependency", back_populates="w_")
 
-    match_keys = [p_id, c_id, s_id, g_id, id]
+    match_keys = (p_id, c_id, s_id, g_id, id)
 
     @hybrid_property
     def butler_repo(self) -> Any:
@@ -0,0 +1,55 @@
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+from lsst.cm.tools.core.dbid import DbId
+from lsst.cm.tools.core.handler import Handler
+from lsst.cm.tools.core.utils import LevelEnum
+from lsst.cm.tools.db.sqlalch_interface import SQLAlchemyInterface
+
+
+@pytest.fixture
+def iface(tmp_path: Path) -> SQLAlchemyInterface:
+    """Interface to a new, empty, database using the example handlers"""
+    Handler.plugin_dir = "examples/handlers/"
+    Handler.config_dir = "examples/configs/"
+    os.environ["CM_CONFIGS"] = Handler.config_dir
+    return SQLAlchemyInterface(f"sqlite:///{tmp_path / 'cm.db'}", echo=False, create=True)
+
+
+@pytest.fixture
+def example_campaign(iface: SQLAlchemyInterface, tmp_path: Path) -> DbId:
+    """Insert the example campaign and launch its first jobs
+
+    Returns the id of the campaign, example/test
+    """
+    iface.insert(None, None, None, production_name="example")
+    config = iface.parse_config("example", "example_config.yaml")
+    iface.insert(
+        iface.get_db_id(production_name="example"),
+        "campaign",
+        config,
+        production_name="example",
+        campaign_name="test",
+        butler_repo="repo",
+        lsst_version="dummy",
+        prod_base_url=str(tmp_path / "archive"),
+    )
+    db_c_id = iface.get_db_id(production_name="example", campaign_name="test")
+    iface.queue_jobs(LevelEnum.campaign, db_c_id)
+    iface.launch_jobs(LevelEnum.campaign, db_c_id, 100)
+    return db_c_id
+
+
+@pytest.fixture
+def sql_statements(iface: SQLAlchemyInterface) -> list[str]:
+    """Record the SQL statements sent through the interface's session"""
+    statements: list[str] = []
+    event.listen(
+        iface.connection().get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
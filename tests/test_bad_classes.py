@@ -13,6 +13,15 @@ def test_bad_checker() -> None:
     with pytest.raises(TypeError):
         Checker.get_checker("lsst.cm.tools.core")
 
+    with pytest.raises(TypeError):
+        Checker.get_checker("lsst.cm.tools.core.slurm_utils")
+
+    with pytest.raises(ModuleNotFoundError):
+        Checker.get_checker("NoDots")
+
+    with pytest.raises(ImportError):
+        Checker.get_checker("lsst.cm.tools.core.slurm_utils.NoSuchChecker")
+
 
 def test_bad_handler() -> None:
     class BadHandler(Handler):
@@ -1,13 +1,19 @@
+import io
 import os
 import shutil
 import sys
+from typing import Any
 
 import yaml
+from sqlalchemy import select
 
 from lsst.cm.tools.core import panda_utils
+from lsst.cm.tools.core.dbid import DbId
 from lsst.cm.tools.core.handler import Handler
 from lsst.cm.tools.core.utils import LevelEnum, StatusEnum
+from lsst.cm.tools.db.error_table import ErrorInstance, ErrorType
 from lsst.cm.tools.db.sqlalch_interface import SQLAlchemyInterface
+from lsst.cm.tools.db.workflow import Workflow
 
 
 def test_error_handling() -> None:
@@ -104,5 +110,98 @@ def test_error_matching() -> None:
     iface.report_error_trend(sys.stdout, "kron_kron")
 
 
+def test_rematch_errors(iface: SQLAlchemyInterface) -> None:
+    conn = iface.connection()
+    conn.add_all(
+        [
+            ErrorType(panda_err_code="code, 1", error_name="bad_regex", diagnostic_message="unclosed ("),
+            ErrorType(panda_err_code="code, 1", error_name="no_message", diagnostic_message=None),
+            ErrorType(panda_err_code="code, 1", error_name="good", diagnostic_message="known failure.*"),
+            ErrorType(panda_err_code="code, 2", error_name="unused_bad", diagnostic_message="[oops"),
+        ]
+    )
+    conn.add_all(
+        [
+            ErrorInstance(panda_err_code="code, 1", diagnostic_message="known failure in task"),
+            ErrorInstance(panda_err_code="code, 1", diagnostic_message="something else"),
+            ErrorInstance(panda_err_code="code, 3", diagnostic_message="known failure"),
+        ]
+    )
+    conn.commit()
+
+    # the malformed error types are skipped, rather than stopping the rematch
+    iface.rematch_errors()
+
+    matched = {
+        error_.diagnostic_message: error_.error_name
+        for error_ in conn.execute(select(ErrorInstance)).scalars()
+    }
+    assert matched == {
+        "known failure in task": "good",
+        "something else": None,
+        "known failure": None,
+    }
+
+
+def test_report_error_summary(iface: SQLAlchemyInterface, example_campaign: DbId) -> None:
+    db_c_id = example_campaign
+
+    def report(level: LevelEnum, db_id: DbId, **kwargs: Any) -> list[str]:
+        stream = io.StringIO()
+        iface.report_errors(stream, level, db_id, summary=True, **kwargs)
+        return stream.getvalue().splitlines()
+
+    # No errors yet, so only the header is written
+    assert iface.count_errors(LevelEnum.campaign, db_c_id) == 0
+    assert report(LevelEnum.campaign, db_c_id) == ["~Here are the errors!~"]
+
+    names = dict(production_name="example", campaign_name="test", step_name="step1")
+    db_w_ids = [iface.get_db_id(**names, group_name=f"group_{idx}", workflow_idx=0) for idx in range(3)]
+    workflows = [iface.get_entry(LevelEnum.workflow, db_w_id) for db_w_id in db_w_ids]
+    job_a = workflows[0].jobs_[0]
+    job_b = workflows[1].jobs_[0]
+    assert job_a.id < job_b.id
+
+    # Errors are added for the later job first, so that ordering by
+    # job and ordering by error instance disagree
+    conn = iface.connection()
+    for job_, error_names in [(job_b, ["beta", "beta", "gamma"]), (job_a, ["alpha", "beta", None])]:
+        conn.add_all([ErrorInstance(job_id=job_.id, error_name=error_name) for error_name in error_names])
+    conn.commit()
+
+    assert iface.count_errors(LevelEnum.campaign, db_c_id) == 6
+    assert iface.count_errors(LevelEnum.workflow, db_w_ids[0]) == 3
+    assert iface.count_errors(LevelEnum.workflow, db_w_ids[1]) == 3
+    assert iface.count_errors(LevelEnum.workflow, db_w_ids[2]) == 0
+    assert report(LevelEnum.workflow, db_w_ids[2]) == ["~Here are the errors!~"]
+
+    # Names come in the order of their first occurrence,
+    # going through the jobs and then the errors of each job
+    assert report(LevelEnum.campaign, db_c_id) == [
+        "~Here are the errors!~",
+        "Error: alpha:  1",
+        "Error: beta:  3",
+        "Error: None:  1",
+        "Error: gamma:  1",
+    ]
+
+    # The full listing gives the names in the same order
+    stream = io.StringIO()
+    iface.report_errors(stream, LevelEnum.campaign, db_c_id)
+    listed = [line for line in stream.getvalue().splitlines() if line.startswith("Error: ")]
+    assert listed == ["Error: alpha", "Error: beta", "Error: None", "Error: gamma"]
+
+    # Nothing is up for review yet
+    assert report(LevelEnum.campaign, db_c_id, review=True) == ["~Here are the errors!~"]
+
+    # Only the errors from workflows up for review are counted
+    Workflow.update_values(iface, workflows[1].id, status=StatusEnum.reviewable)
+    assert report(LevelEnum.campaign, db_c_id, review=True) == [
+        "~Here are the errors!~",
+        "Error: beta:  2",
+        "Error: gamma:  1",
+    ]
+
+
 if __name__ == "__main__":
     test_error_matching()
@@ -1,13 +1,26 @@
 import os
 import shutil
 import sys
+from collections import Counter
+from pathlib import Path
 
 import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
 
 # from lsst.cm.tools.core.db_interface import DbId
+from lsst.cm.tools.core.dbid import DbId
 from lsst.cm.tools.core.handler import Handler
 from lsst.cm.tools.core.utils import LevelEnum, StatusEnum, TableEnum
+from lsst.cm.tools.db.common import column_getter
 from lsst.cm.tools.db.dependency import Dependency
+from lsst.cm.tools.db.group import Group
+from lsst.cm.tools.db.handler_utils import (
+    accept_jobs,
+    accept_scripts,
+    extract_child_status,
+    extract_completion_status,
+)
+from lsst.cm.tools.db.job import Job
 from lsst.cm.tools.db.script import Script
 from lsst.cm.tools.db.sqlalch_interface import SQLAlchemyInterface
 
@@ -729,5 +742,214 @@ def test_table_repr() -> None:
     assert repr(script)
 
 
+def test_column_getter() -> None:
+    metadata = MetaData()
+    one_col = Table("one_col", metadata, Column("id", Integer, primary_key=True))
+    two_col = Table("two_col", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+
+    class Row:
+        id = 3
+        name = "abc"
+
+    names, getter = column_getter(one_col)
+    assert dict(zip(names, getter(Row))) == dict(id=3)
+    names, getter = column_getter(two_col)
+    assert dict(zip(names, getter(Row))) == dict(id=3, name="abc")
+
+
+def test_get_db_id(
+    iface: SQLAlchemyInterface, example_campaign: DbId, sql_statements: list[str], tmp_path: Path
+) -> None:
+    names = dict(
+        production_name="example",
+        campaign_name="test",
+        step_name="step1",
+        group_name="group_4",
+        workflow_idx=0,
+    )
+    full_ids = iface.get_db_id(**names).to_tuple()
+    assert None not in full_ids
+    assert full_ids[:2] == example_campaign.to_tuple()[:2]
+
+    # Names given down to each level match down to that level
+    name_items = list(names.items())
+    for n_names in range(1, len(name_items) + 1):
+        db_id = iface.get_db_id(**dict(name_items[:n_names]))
+        assert db_id.to_tuple() == full_ids[:n_names] + (None,) * (len(name_items) - n_names)
+        entry = iface.get_entry(db_id.level(), db_id)
+        assert iface.get_db_id(fullname=entry.fullname) == db_id
+
+    # The fullname carries the workflow index as a string
+    assert iface.get_db_id(fullname="example/test/step1/group_4/w00").to_tuple() == full_ids
+    assert iface.get_db_id().to_tuple() == (None,) * 5
+
+    # A missing name leaves the ids at and below that level unset
+    assert iface.get_db_id(production_name="missing", campaign_name="test").to_tuple() == (None,) * 5
+    missing_step = dict(names, step_name="missing")
+    assert iface.get_db_id(**missing_step).to_tuple() == full_ids[:2] + (None,) * 3
+    missing_group = dict(names, group_name="missing")
+    assert iface.get_db_id(**missing_group).to_tuple() == full_ids[:3] + (None,) * 2
+    missing_workflow = dict(names, workflow_idx=99)
+    assert iface.get_db_id(**missing_workflow).to_tuple() == full_ids[:4] + (None,)
+
+    # Repeated complete matches do not go back to the database
+    n_statements = len(sql_statements)
+    assert iface.get_db_id(**names).to_tuple() == full_ids
+    assert iface.get_db_id(fullname="example/test/step1/group_4/w00").to_tuple() == full_ids
+    assert len(sql_statements) == n_statements
+
+    # An entry added after a partial match is found
+    iface.insert(None, None, None, production_name="other")
+    db_p_id = iface.get_db_id(production_name="other")
+    assert iface.get_db_id(production_name="other", campaign_name="test") == db_p_id
+    iface.insert(
+        db_p_id,
+        "campaign",
+        iface.get_config("example"),
+        production_name="other",
+        campaign_name="test",
+        butler_repo="repo",
+        lsst_version="dummy",
+        prod_base_url=str(tmp_path / "archive_other"),
+    )
+    db_c_id = iface.get_db_id(production_name="other", campaign_name="test")
+    assert db_c_id.to_tuple()[0] == db_p_id.to_tuple()[0]
+    assert db_c_id.to_tuple()[1] is not None
+
+
+def test_get_config_cache(iface: SQLAlchemyInterface, sql_statements: list[str]) -> None:
+    # A config added after a miss is found
+    assert iface.get_config("test_config") is None
+    config = iface.parse_config("test_config", "example_config.yaml")
+    assert iface.get_config("test_config") is config
+
+    # Repeated hits give the same object, without going back to the database
+    n_statements = len(sql_statements)
+    assert iface.get_config("test_config") is config
+    assert len(sql_statements) == n_statements
+
+
+def test_child_status(iface: SQLAlchemyInterface, example_campaign: DbId) -> None:
+    db_s_id = iface.get_db_id(production_name="example", campaign_name="test", step_name="step1")
+    step = iface.get_entry(LevelEnum.step, db_s_id)
+    groups = {group.name: group for group in step.children()}
+    assert len(groups) == 10
+
+    # A superseded child is not counted, whatever its status
+    Group.update_values(iface, groups["group_0"].id, status=StatusEnum.failed, superseded=True)
+    for idx in range(1, 10):
+        Group.update_values(iface, groups[f"group_{idx}"].id, status=StatusEnum.accepted)
+
+    def check(
+        expected_counts: dict[StatusEnum, int],
+        child_status: StatusEnum,
+        completion_status: StatusEnum,
+    ) -> None:
+        status_counts = iface.count_child_status(LevelEnum.step, db_s_id)
+        assert status_counts == expected_counts
+        assert status_counts == Counter(group.status for group in step.children() if not group.superseded)
+        assert extract_child_status(status_counts, StatusEnum.populating, StatusEnum.running) == child_status
+        assert (
+            extract_completion_status(status_counts, StatusEnum.running, StatusEnum.collectable)
+            == completion_status
+        )
+
+    check({StatusEnum.accepted: 9}, StatusEnum.running, StatusEnum.collectable)
+
+    # Past accepted still counts as done, as long as something was accepted
+    Group.update_values(iface, groups["group_1"].id, status=StatusEnum.rescuable)
+    check({StatusEnum.accepted: 8, StatusEnum.rescuable: 1}, StatusEnum.running, StatusEnum.collectable)
+    for idx in range(2, 10):
+        Group.update_values(iface, groups[f"group_{idx}"].id, status=StatusEnum.rescuable)
+    check({StatusEnum.rescuable: 9}, StatusEnum.running, StatusEnum.running)
+
+    # The least advanced child sets the status, clipped to the range
+    Group.update_values(iface, groups["group_2"].id, status=StatusEnum.collecting)
+    Group.update_values(iface, groups["group_3"].id, status=StatusEnum.accepted)
+    check(
+        {StatusEnum.collecting: 1, StatusEnum.accepted: 1, StatusEnum.rescuable: 7},
+        StatusEnum.running,
+        StatusEnum.running,
+    )
+    Group.update_values(iface, groups["group_4"].id, status=StatusEnum.ready)
+    check(
+        {StatusEnum.ready: 1, StatusEnum.collecting: 1, StatusEnum.accepted: 1, StatusEnum.rescuable: 6},
+        StatusEnum.populating,
+        StatusEnum.running,
+    )
+    Group.update_values(iface, groups["group_4"].id, status=StatusEnum.failed)
+    check(
+        {StatusEnum.failed: 1, StatusEnum.collecting: 1, StatusEnum.accepted: 1, StatusEnum.rescuable: 6},
+        StatusEnum.populating,
+        StatusEnum.running,
+    )
+
+    # Workflows have no child entries
+    db_w_id = iface.get_db_id(
+        production_name="example",
+        campaign_name="test",
+        step_name="step1",
+        group_name="group_1",
+        workflow_idx=0,
+    )
+    assert iface.count_child_status(LevelEnum.workflow, db_w_id) == {}
+
+
+def test_accept_many(iface: SQLAlchemyInterface, example_campaign: DbId, sql_statements: list[str]) -> None:
+    names = dict(production_name="example", campaign_name="test", step_name="step1")
+    workflows = [
+        iface.get_entry(
+            LevelEnum.workflow, iface.get_db_id(**names, group_name=f"group_{idx}", workflow_idx=0)
+        )
+        for idx in range(5)
+    ]
+    jobs = [workflow.jobs_[0] for workflow in workflows]
+
+    sql_statements.clear()
+
+    # Nothing to update means no statement at all
+    Job.update_many(iface, [], status=StatusEnum.accepted)
+    assert not sql_statements
+
+    Job.update_many(iface, [job.id for job in jobs], status=StatusEnum.reviewable)
+    assert len(sql_statements) == 1
+    Job.update_values(iface, jobs[1].id, superseded=True)
+    Job.update_values(iface, jobs[2].id, status=StatusEnum.running)
+    Job.update_values(iface, jobs[4].id, status=StatusEnum.failed)
+
+    # Only reviewable jobs that are not superseded are accepted,
+    # and the jobs already loaded in the session see the new status
+    n_statements = len(sql_statements)
+    accept_jobs(iface, jobs)
+    assert len(sql_statements) == n_statements + 1
+    assert [job.status for job in jobs] == [
+        StatusEnum.accepted,
+        StatusEnum.reviewable,
+        StatusEnum.running,
+        StatusEnum.accepted,
+        StatusEnum.failed,
+    ]
+    assert jobs[1].superseded
+
+    Job.update_values(iface, jobs[4].id, status=StatusEnum.reviewable)
+    accept_jobs(iface, [jobs[0], jobs[4]], rescuable=True)
+    assert jobs[0].status == StatusEnum.accepted
+    assert jobs[4].status == StatusEnum.rescuable
+
+    # The session agrees with the database
+    sel = select(Job.status).where(Job.id.in_([job.id for job in jobs])).order_by(Job.id)
+    assert list(iface.connection().execute(sel).scalars()) == [job.status for job in jobs]
+
+    # All the scripts of an entry are accepted in one statement
+    scripts = workflows[0].scripts_
+    assert scripts
+    other_status = [script.status for script in workflows[1].scripts_]
+    n_statements = len(sql_statements)
+    accept_scripts(iface, scripts)
+    assert len(sql_statements) == n_statements + 1
+    assert all(script.status == StatusEnum.accepted for script in scripts)
+    assert [script.status for script in workflows[1].scripts_] == other_status
+
+
 if __name__ == "__main__":
     test_full_example()